@@ -8,7 +8,7 @@ from .config import (
     COMMAND_COOLDOWN_SECONDS,
     OWNER_ID,
 )
-from .helpers import now
+from .helpers import now_mono
 
 
 def is_guild_admin(self, member: discord.Member) -> bool:
@@ -34,19 +34,22 @@ async def command_cooldown_check(self, interaction: discord.Interaction) -> bool
         return True
     user = getattr(interaction, "user", None)
     user_id = getattr(user, "id", None)
+    # Without a user there is no per-user slot; don't share one under key 0.
+    if user_id is None:
+        return True
     # Owner bypass
     if OWNER_ID and user_id == OWNER_ID:
         return True
     # Bot admin bypass (per-guild)
     try:
         if interaction.guild:
-            if await self.db.is_admin(interaction.guild.id, user_id):  # type: ignore[arg-type]
+            if await self.db.is_admin(interaction.guild.id, user_id):
                 return True
     except Exception:
         pass
     # Check cooldown
-    now_ts = now()
-    last = self._cmd_cooldown_last.get(user_id or 0, 0.0)
+    now_ts = now_mono()
+    last = self._cmd_cooldown_last.get(user_id, float("-inf"))
     remain = cd - (now_ts - last)
     if remain > 0:
         # Best-effort friendly message
@@ -2,71 +2,124 @@
 # https://github.com/NanashiTheNameless/NamelessNameSanitizerBot/blob/main/LICENSE.md
 """Autocomplete helpers for SanitizerBot commands."""
 
+import heapq
+
 import discord  # type: ignore
 
 from .config import OWNER_ID
 
+_BOOL_CHOICES: tuple[discord.app_commands.Choice[str], ...] = tuple(
+    discord.app_commands.Choice(name=v, value=v)
+    for v in ("true", "false", "yes", "no", "on", "off", "1", "0")
+)
+_FALLBACK_MODE_CHOICES: tuple[discord.app_commands.Choice[str], ...] = tuple(
+    discord.app_commands.Choice(name=v, value=v)
+    for v in ("default", "randomized", "static")
+)
+# Setting keys offered by the policy-key autocomplete.
+_POLICY_KEYS: tuple[discord.app_commands.Choice[str], ...] = (
+    discord.app_commands.Choice(name="enabled (True/False)", value="enabled"),
+    discord.app_commands.Choice(name="check_length (integer)", value="check_length"),
+    discord.app_commands.Choice(
+        name="min_nick_length (integer)", value="min_nick_length"
+    ),
+    discord.app_commands.Choice(
+        name="max_nick_length (integer)", value="max_nick_length"
+    ),
+    discord.app_commands.Choice(
+        name="cooldown_seconds (integer)", value="cooldown_seconds"
+    ),
+    discord.app_commands.Choice(
+        name="preserve_spaces (True/False)", value="preserve_spaces"
+    ),
+    discord.app_commands.Choice(
+        name="sanitize_emoji (True/False)", value="sanitize_emoji"
+    ),
+    discord.app_commands.Choice(name="enforce_bots (True/False)", value="enforce_bots"),
+    discord.app_commands.Choice(
+        name="logging_channel_id (channel id or none)",
+        value="logging_channel_id",
+    ),
+    discord.app_commands.Choice(
+        name="bypass_role_id (role id list comma/space delimited, or none)",
+        value="bypass_role_id",
+    ),
+    discord.app_commands.Choice(
+        name="fallback_mode (default|randomized|static)",
+        value="fallback_mode",
+    ),
+    discord.app_commands.Choice(
+        name="fallback_label (1-20, letters/numbers/spaces/dashes)",
+        value="fallback_label",
+    ),
+)
+# Pre-lowered (choice, name, value) triples for per-keystroke matching.
+_POLICY_KEYS_LOWERED = tuple((c, c.name.lower(), c.value.lower()) for c in _POLICY_KEYS)
+_INT_CHOICE_VALUES = ("0", "1", "2", "3", "5", "10", "15", "30", "60")
+_CHECK_COUNT_CHOICE_VALUES = ("0", "4", "6", "8", "10", "18")
+# Only allow suggestions up to 8 for min length
+_MIN_LENGTH_CHOICE_VALUES = tuple(str(i) for i in range(0, 9))
+# Provide curated choices up to 32 for max length
+_MAX_LENGTH_CHOICE_VALUES = ("16", "20", "24", "28", "30", "32")
+
+
+def _int_choices(
+    values: tuple[str, ...],
+) -> tuple[discord.app_commands.Choice[int], ...]:
+    return tuple(discord.app_commands.Choice(name=v, value=int(v)) for v in values)
+
+
+_INT_CHOICES = _int_choices(_INT_CHOICE_VALUES)
+_CHECK_COUNT_CHOICES = _int_choices(_CHECK_COUNT_CHOICE_VALUES)
+_MIN_LENGTH_CHOICES = _int_choices(_MIN_LENGTH_CHOICE_VALUES)
+_MAX_LENGTH_CHOICES = _int_choices(_MAX_LENGTH_CHOICE_VALUES)
+
+
+def _int_choices_with_current(
+    current: str, choices: tuple[discord.app_commands.Choice[int], ...]
+) -> list[discord.app_commands.Choice[int]]:
+    """Return the prebuilt choices, with a typed integer promoted to the front."""
+    if current and current.isdigit():
+        typed = discord.app_commands.Choice(name=current, value=int(current))
+        return [typed] + [c for c in choices if c.name != current][:24]
+    return list(choices[:25])
+
 
 async def ac_policy_key(self, interaction: discord.Interaction, current: str):
     current_l = (current or "").lower()
+    if not current_l:
+        return list(_POLICY_KEYS[:25])
     choices = [
         c
-        for c in self._policy_keys
-        if current_l in c.name.lower() or current_l in c.value.lower()
+        for c, name_l, value_l in _POLICY_KEYS_LOWERED
+        if current_l in name_l or current_l in value_l
     ]
     return choices[:25]
 
 
 async def ac_bool_value(self, interaction: discord.Interaction, current: str):
-    opts = [
-        discord.app_commands.Choice(name="true", value="true"),
-        discord.app_commands.Choice(name="false", value="false"),
-        discord.app_commands.Choice(name="yes", value="yes"),
-        discord.app_commands.Choice(name="no", value="no"),
-        discord.app_commands.Choice(name="on", value="on"),
-        discord.app_commands.Choice(name="off", value="off"),
-        discord.app_commands.Choice(name="1", value="1"),
-        discord.app_commands.Choice(name="0", value="0"),
-    ]
     current_l = (current or "").lower()
-    return [c for c in opts if current_l in c.name][:25]
+    if not current_l:
+        return list(_BOOL_CHOICES)
+    return [c for c in _BOOL_CHOICES if current_l in c.name][:25]
 
 
 async def ac_int_value(self, interaction: discord.Interaction, current: str):
-    suggestions = ["0", "1", "2", "3", "5", "10", "15", "30", "60"]
-    if current and current.isdigit():
-        suggestions = [current] + [s for s in suggestions if s != current]
-    return [discord.app_commands.Choice(name=s, value=int(s)) for s in suggestions][:25]
+    return _int_choices_with_current(current, _INT_CHOICES)
 
 
 async def ac_check_count_value(self, interaction: discord.Interaction, current: str):
     # Curated suggestions for check_length
-    base = ["0", "4", "6", "8", "10", "18"]
-    current_l = (current or "").strip()
-    vals = base
-    if current_l and current_l.isdigit():
-        vals = [current_l] + [v for v in base if v != current_l]
-    return [discord.app_commands.Choice(name=v, value=int(v)) for v in vals][:25]
+    return _int_choices_with_current((current or "").strip(), _CHECK_COUNT_CHOICES)
 
 
 async def ac_min_length_value(self, interaction: discord.Interaction, current: str):
-    # Only allow suggestions up to 8 for min length
-    vals = [str(i) for i in range(0, 9)]
-    current_l = (current or "").strip()
-    if current_l and current_l.isdigit():
-        # Show the typed value first (even if > 8, we will still validate on submit)
-        vals = [current_l] + [v for v in vals if v != current_l]
-    return [discord.app_commands.Choice(name=v, value=int(v)) for v in vals][:25]
+    # Show the typed value first (even if > 8, we will still validate on submit)
+    return _int_choices_with_current((current or "").strip(), _MIN_LENGTH_CHOICES)
 
 
 async def ac_max_length_value(self, interaction: discord.Interaction, current: str):
-    # Provide curated choices up to 32 for max length
-    base = ["16", "20", "24", "28", "30", "32"]
-    current_l = (current or "").strip()
-    vals = base
-    if current_l and current_l.isdigit():
-        vals = [current_l] + [v for v in base if v != current_l]
-    return [discord.app_commands.Choice(name=v, value=int(v)) for v in vals][:25]
+    return _int_choices_with_current((current or "").strip(), _MAX_LENGTH_CHOICES)
 
 
 async def ac_fallback_mode(self, interaction: discord.Interaction, current: str):
@@ -74,34 +127,15 @@ async def ac_fallback_mode(self, interaction: discord.Interaction, current: str)
 
     Provides the valid fallback modes filtered by the user's current partial input.
     """
-    opts = [
-        discord.app_commands.Choice(name="default", value="default"),
-        discord.app_commands.Choice(name="randomized", value="randomized"),
-        discord.app_commands.Choice(name="static", value="static"),
-    ]
     cur_l = (current or "").lower()
-    return [o for o in opts if cur_l in o.name][:25]
+    if not cur_l:
+        return list(_FALLBACK_MODE_CHOICES)
+    return [o for o in _FALLBACK_MODE_CHOICES if cur_l in o.name][:25]
 
 
 async def ac_policy_value(self, interaction: discord.Interaction, current: str):
     key = getattr(getattr(interaction, "namespace", object()), "key", None)
     key = (key or "").lower()
-
-    aliases = {
-        "enabled": "enabled",
-        "check_length": "check_length",
-        "min_nick_length": "min_nick_length",
-        "max_nick_length": "max_nick_length",
-        "cooldown_seconds": "cooldown_seconds",
-        "fallback_label": "fallback_label",
-        "logging_channel_id": "logging_channel_id",
-        "bypass_role_id": "bypass_role_id",
-        "enforce_bots": "enforce_bots",
-        "preserve_spaces": "preserve_spaces",
-        "sanitize_emoji": "sanitize_emoji",
-        "fallback_mode": "fallback_mode",
-    }
-    key = aliases.get(key, key)
     if key in {
         "check_length",
         "min_nick_length",
@@ -129,13 +163,7 @@ async def ac_policy_value(self, interaction: discord.Interaction, current: str):
         "fallback_mode",  # special-case handled below
     }:
         if key == "fallback_mode":
-            opts = [
-                discord.app_commands.Choice(name="default", value="default"),
-                discord.app_commands.Choice(name="randomized", value="randomized"),
-                discord.app_commands.Choice(name="static", value="static"),
-            ]
-            cur_l = (current or "").lower()
-            return [o for o in opts if cur_l in o.name][:25]
+            return await ac_fallback_mode(self, interaction, current)
         return await ac_bool_value(self, interaction, current)
     # For ID-like settings suggest 'none' and current channel/role where applicable
     if key in {"logging_channel_id", "bypass_role_id"}:
@@ -202,16 +230,20 @@ async def ac_guild_id(self, interaction: discord.Interaction, current: str):
     except Exception:
         return []
     current = (current or "").strip().lower()
+    matches = [
+        g
+        for g in self.guilds
+        if not current or current in (g.name or "").lower() or current in str(g.id)
+    ]
+    # Filter first, then keep the 25 smallest by name; no full sort per keystroke.
+    top = heapq.nsmallest(25, matches, key=lambda gg: (gg.name or "", gg.id))
     # Build choices as "Name (ID)" with value=ID string
-    choices = []
-    for g in sorted(self.guilds, key=lambda gg: (gg.name or "", gg.id))[:25]:
-        name = g.name or "<unnamed>"
-        label = f"{name} ({g.id})"
-        if not current or current in name.lower() or current in str(g.id):
-            choices.append(discord.app_commands.Choice(name=label, value=str(g.id)))
-        if len(choices) >= 25:
-            break
-    return choices
+    return [
+        discord.app_commands.Choice(
+            name=f"{g.name or '<unnamed>'} ({g.id})", value=str(g.id)
+        )
+        for g in top
+    ]
 
 
 async def ac_blacklisted_guild_id(self, interaction: discord.Interaction, current: str):
@@ -8,6 +8,10 @@ command registration, event handlers, and all bot functionality.
 """
 
 import asyncio
+import dataclasses
+import functools
+import hashlib
+import json
 import logging
 import math
 import shlex
@@ -38,21 +42,30 @@ from .config import (
     APPLICATION_ID,
     DATABASE_URL,
     DM_OWNER_ON_GUILD_EVENTS,
+    FORCE_COMMAND_SYNC,
     MAX_NICK_LENGTH,
     MIN_NICK_LENGTH,
     OWNER_ID,
+    SWEEP_GUILD_CONCURRENCY,
     GuildSettings,
     parse_bool_strict,
 )
 from .database import Database
 from .events import (
+    on_guild_channel_delete,
     on_guild_join,
     on_guild_remove,
     on_member_join,
     on_message,
     on_ready,
 )
-from .helpers import now, owner_destructive_check, resolve_target_guild
+from .helpers import (
+    now,
+    now_mono,
+    owner_destructive_check,
+    resolve_target_guild,
+    touch_recent,
+)
 from .reports import (
     dm_admin_report,
     dm_all_reports,
@@ -88,6 +101,211 @@ except Exception as e:
     log.warning("[VERSION] Disabled: failed to import version check module (%s).", e)
 
 
+# Policy keys accepted by /set-policy.
+_ALLOWED_USER_KEYS = frozenset(
+    {
+        "enabled",
+        "preserve_spaces",
+        "sanitize_emoji",
+        "enforce_bots",
+        "check_length",
+        "min_nick_length",
+        "max_nick_length",
+        "cooldown_seconds",
+        "logging_channel_id",
+        "bypass_role_id",
+        "fallback_mode",
+        "fallback_label",
+    }
+)
+_NONE_TOKENS = frozenset({"none", "null", "unset"})
+_FALLBACK_MODES = frozenset({"default", "randomized", "static"})
+# Characters allowed in fallback labels, used as a bytes.translate() deletion table.
+_FALLBACK_LABEL_CHARS = (
+    b"ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789 -"
+)
+# Patterns used by role parsing, server-id resolution and /check diagnostics.
+_ROLE_ID_SEPARATORS = re.compile(r"[\s,]+")
+_DIGITS = re.compile(r"\d+")
+_SERVER_ID_SUFFIX = re.compile(r"\((\d+)\)")
+_GRAPHEME = re.compile(r"\X")
+_WHITESPACE_RUN = re.compile(r"\s+")
+# Channel types the bot posts log and broadcast messages to.
+_SENDABLE_CHANNEL_TYPES = (discord.TextChannel, discord.Thread)
+# Maximum logging-channel sends in flight during an owner broadcast.
+_BROADCAST_CONCURRENCY = 20
+# Seconds before retrying a logging channel that could not be fetched.
+_LOG_CHANNEL_RETRY_SEC = 300
+# bot_meta key holding the hash of the last synced slash command payload.
+_COMMANDS_HASH_KEY = "commands_hash"
+# Minimum seconds between /sweep-now progress edits.
+_SWEEP_PROGRESS_INTERVAL_SEC = 10
+
+
+# Canned ephemeral replies shared by the command guards.
+_MSG_CONFIG_ERROR = "The bot is currently disabled due to configuration issue(s). Please contact the bot owner."
+_MSG_GUILD_ONLY = "This command can only be used in a server."
+_MSG_ADMIN_ONLY = "Only bot admins can modify settings."
+_MSG_OWNER_ONLY = "Only the bot owner can perform this action."
+
+# Appended to settings replies while the sanitizer is disabled in the guild.
+_WARN_DISABLED = "Note: The sanitizer is currently disabled in this server. Changes will apply after a bot admin runs `/enable-sanitizer`."
+_WARN_ENFORCEMENT_PAUSED = "Note: The sanitizer is currently disabled in this server. Automatic enforcement is paused until an admin runs `/enable-sanitizer`."
+
+
+def _requires(*, config=False, owner=False, guild=False, admin=False):
+    """Guard a cmd_* method with the standard precondition checks.
+
+    Checks run in order (configuration error, owner, guild context, bot admin)
+    and the first failure replies with its canned ephemeral message.
+    """
+
+    def decorator(func):
+        @functools.wraps(func)
+        async def wrapper(self, interaction: discord.Interaction, *args, **kwargs):
+            is_owner = bool(OWNER_ID) and interaction.user.id == OWNER_ID
+            if config and self._config_error:
+                msg = _MSG_CONFIG_ERROR
+            elif owner and not is_owner:
+                msg = _MSG_OWNER_ONLY
+            elif guild and not interaction.guild:
+                msg = _MSG_GUILD_ONLY
+            # The owner is always a bot admin; skip the admin lookup entirely.
+            elif (
+                admin
+                and not is_owner
+                and not await self._is_bot_admin(
+                    interaction.guild.id, interaction.user.id
+                )
+            ):
+                msg = _MSG_ADMIN_ONLY
+            else:
+                return await func(self, interaction, *args, **kwargs)
+            await interaction.response.send_message(msg, ephemeral=True)
+
+        return wrapper
+
+    return decorator
+
+
+def _with_warn(text: str, enabled: bool, note: str = _WARN_DISABLED) -> str:
+    """Append the disabled-sanitizer note to a reply unless the guild is enabled."""
+    return text if enabled else f"{text}\n{note}"
+
+
+def _role_mentions(role_ids) -> str:
+    """Render role IDs as a comma-separated list of role mentions."""
+    return ", ".join([f"<@&{rid}>" for rid in role_ids])
+
+
+def _is_valid_fallback_label(lab: str) -> bool:
+    """Fallback labels are 1-20 letters, numbers, spaces, or dashes."""
+    if not 1 <= len(lab) <= 20:
+        return False
+    # Non-ASCII characters are dropped by encode(); anything left after deleting
+    # the allowed bytes is an illegal character.
+    raw = lab.encode("ascii", "ignore")
+    return len(raw) == len(lab) and not raw.translate(None, _FALLBACK_LABEL_CHARS)
+
+
+@functools.lru_cache(maxsize=256)
+def _parse_role_ids(raw: str) -> tuple[int, ...]:
+    """Parse a comma/space separated role list; cached since it runs per member."""
+    ids: list[int] = []
+    for tok in _ROLE_ID_SEPARATORS.split(raw.strip()):
+        if not tok:
+            continue
+        try:
+            match = _DIGITS.search(tok)
+            if not match:
+                raise ValueError("No role id found")
+            ids.append(int(match.group(0)))
+        except Exception as e:
+            raise ValueError(f"Invalid role id: {tok}") from e
+    return tuple(ids)
+
+
+def _has_any_role(member: discord.Member, role_ids) -> bool:
+    # get_role() checks the member's sorted role-id list instead of building
+    # the Role objects that member.roles allocates.
+    return any(member.get_role(rid) is not None for rid in role_ids)
+
+
+def _clamped_int_parser(lo: int, hi: Optional[int] = None):
+    def _parse(self, raw: str) -> int:
+        v = max(lo, int(raw))
+        return v if hi is None else min(hi, v)
+
+    return _parse
+
+
+def _parse_bool_setting(self, raw: str) -> bool:
+    return parse_bool_strict(raw)
+
+
+def _parse_logging_channel_setting(self, raw: str) -> Optional[int]:
+    raw = raw.strip()
+    return None if raw.lower() in _NONE_TOKENS else int(raw)
+
+
+def _parse_bypass_role_setting(self, raw: str) -> Optional[list[int]]:
+    raw = raw.strip()
+    return None if raw.lower() in _NONE_TOKENS else self._parse_bypass_role_list(raw)
+
+
+def _parse_fallback_label_setting(self, raw: str) -> Optional[str]:
+    lab = raw.strip()
+    if lab.lower() in _NONE_TOKENS:
+        return None
+    if not _is_valid_fallback_label(lab):
+        raise ValueError(
+            "fallback_label must be 1-20 characters: letters, numbers, spaces, or dashes"
+        )
+    return lab
+
+
+def _parse_fallback_mode_setting(self, raw: str) -> str:
+    mv = raw.strip().lower()
+    if mv not in _FALLBACK_MODES:
+        raise ValueError("fallback_mode must be one of: default, randomized, static")
+    return mv
+
+
+# Policy key -> (getter(bot, settings), parser(bot, raw_value)) for /set-policy.
+_SETTING_DISPATCH = {
+    "enabled": (lambda self, s: s.enabled, _parse_bool_setting),
+    "check_length": (lambda self, s: s.check_length, _clamped_int_parser(0)),
+    "min_nick_length": (
+        lambda self, s: s.min_nick_length,
+        _clamped_int_parser(0, 8),
+    ),
+    "max_nick_length": (
+        lambda self, s: s.max_nick_length,
+        _clamped_int_parser(1, 32),
+    ),
+    "cooldown_seconds": (lambda self, s: s.cooldown_seconds, _clamped_int_parser(0)),
+    "preserve_spaces": (lambda self, s: s.preserve_spaces, _parse_bool_setting),
+    "sanitize_emoji": (lambda self, s: s.sanitize_emoji, _parse_bool_setting),
+    "enforce_bots": (lambda self, s: s.enforce_bots, _parse_bool_setting),
+    "logging_channel_id": (
+        lambda self, s: s.logging_channel_id,
+        _parse_logging_channel_setting,
+    ),
+    "bypass_role_id": (
+        lambda self, s: self._get_bypass_role_list(s),
+        _parse_bypass_role_setting,
+    ),
+    "fallback_mode": (
+        lambda self, s: getattr(s, "fallback_mode", "default"),
+        _parse_fallback_mode_setting,
+    ),
+    "fallback_label": (
+        lambda self, s: s.fallback_label or "Illegal Name",
+        _parse_fallback_label_setting,
+    ),
+}
+
+
 def _extract_guild_id(server_id_str: str) -> Optional[int]:
     """Extract numeric guild ID from server_id string.
 
@@ -107,9 +325,7 @@ def _extract_guild_id(server_id_str: str) -> Optional[int]:
         pass
 
     # Try extracting from labeled format "name (id)"
-    import re
-
-    match = re.search(r"\((\d+)\)", server_id_str)
+    match = _SERVER_ID_SUFFIX.search(server_id_str)
     if match:
         try:
             return int(match.group(1))
@@ -158,6 +374,8 @@ class SanitizerCommandTree(discord.app_commands.CommandTree):
 
         user = getattr(interaction, "user", None)
         user_id = getattr(user, "id", None)
+        if user_id is None:
+            return
 
         # Owner bypass
         if OWNER_ID and user_id == OWNER_ID:
@@ -178,7 +396,7 @@ class SanitizerCommandTree(discord.app_commands.CommandTree):
 
         # Set cooldown for this user
         if self.client and hasattr(self.client, "_cmd_cooldown_last"):
-            self.client._cmd_cooldown_last[user_id or 0] = now()
+            touch_recent(self.client._cmd_cooldown_last, user_id, now_mono(), cd)
 
 
 class SanitizerBot(discord.Client):
@@ -188,18 +406,26 @@ class SanitizerBot(discord.Client):
                 "APPLICATION_ID environment variable is not set. "
                 "Set APPLICATION_ID to your Discord Application (Client) ID."
             )
-        kwargs = {"intents": intents, "application_id": APPLICATION_ID}
+        kwargs = {
+            "intents": intents,
+            "application_id": APPLICATION_ID,
+            # Sweeps chunk each guild on first use, so filling every guild's
+            # member cache up front would only delay on_ready.
+            "chunk_guilds_at_startup": False,
+        }
         super().__init__(**kwargs)
         self.db = Database(DATABASE_URL) if DATABASE_URL else None
         self.tree = SanitizerCommandTree(self)
         self._cmd_cooldown_last: dict[int, float] = {}
+        # (guild_id, member_id) -> last on_message sanitize check timestamp
+        self._recently_checked: dict[tuple[int, int], float] = {}
         # Separate owner destructive cooldown timestamp
-        self._owner_destructive_last = 0.0
+        self._owner_destructive_last = float("-inf")
 
         # Version check / outdated warning state
         self._outdated_message: Optional[str] = None
         self._outdated_warning_sent_interactions: set[int] = set()
-        self._last_check_update_time: float = 0.0  # For bot-admin cooldown
+        self._last_check_update_time: float = float("-inf")  # For bot-admin cooldown
 
         # Status cycling variables
         self._status_messages: list[dict] = []
@@ -209,11 +435,21 @@ class SanitizerBot(discord.Client):
         self._red_status_triggered = False  # Once True, persists until restart
         self._config_error = False
         self._pending_owner_dms: list[str] = []  # Queue DMs to send on ready
+        self._owner_user: Optional[discord.User] = None  # Resolved on first owner DM
         # Guild IDs explicitly left via owner command; consumed in on_guild_remove.
         self._owner_requested_leave_guild_ids: set[int] = set()
         self._status_cycle_task: asyncio.Task[None] | None = None
         self._sweep_lock = asyncio.Lock()
         self._sweep_running = False
+        self._sweep_guild_semaphore = asyncio.Semaphore(SWEEP_GUILD_CONCURRENCY)
+        self._broadcast_semaphore = asyncio.Semaphore(_BROADCAST_CONCURRENCY)
+        # guild_id -> resolved logging channel; entries are checked against the
+        # configured channel ID on use and dropped on channel delete / guild remove.
+        self._log_channel_cache: dict[int, "discord.TextChannel | discord.Thread"] = {}
+        # Fire-and-forget work (cooldown writes, log posts) started by _spawn_background.
+        self._background_tasks: set[asyncio.Task] = set()
+        # guild_id -> (channel_id, monotonic time) of the last failed channel fetch.
+        self._log_channel_misses: dict[int, tuple[int, float]] = {}
 
         # Validate owner is configured
         if not OWNER_ID:
@@ -230,47 +466,6 @@ class SanitizerBot(discord.Client):
 
         self._load_status_messages()
 
-        self._policy_keys = [
-            discord.app_commands.Choice(name="enabled (True/False)", value="enabled"),
-            discord.app_commands.Choice(
-                name="check_length (integer)", value="check_length"
-            ),
-            discord.app_commands.Choice(
-                name="min_nick_length (integer)", value="min_nick_length"
-            ),
-            discord.app_commands.Choice(
-                name="max_nick_length (integer)", value="max_nick_length"
-            ),
-            discord.app_commands.Choice(
-                name="cooldown_seconds (integer)", value="cooldown_seconds"
-            ),
-            discord.app_commands.Choice(
-                name="preserve_spaces (True/False)", value="preserve_spaces"
-            ),
-            discord.app_commands.Choice(
-                name="sanitize_emoji (True/False)", value="sanitize_emoji"
-            ),
-            discord.app_commands.Choice(
-                name="enforce_bots (True/False)", value="enforce_bots"
-            ),
-            discord.app_commands.Choice(
-                name="logging_channel_id (channel id or none)",
-                value="logging_channel_id",
-            ),
-            discord.app_commands.Choice(
-                name="bypass_role_id (role id list comma/space delimited, or none)",
-                value="bypass_role_id",
-            ),
-            discord.app_commands.Choice(
-                name="fallback_mode (default|randomized|static)",
-                value="fallback_mode",
-            ),
-            discord.app_commands.Choice(
-                name="fallback_label (1-20, letters/numbers/spaces/dashes)",
-                value="fallback_label",
-            ),
-        ]
-
     def _load_status_messages(self):
         load_status_messages(self)
 
@@ -293,7 +488,11 @@ class SanitizerBot(discord.Client):
         if not OWNER_ID:
             return False
         try:
-            user = self.get_user(OWNER_ID) or await self.fetch_user(OWNER_ID)
+            user = self._owner_user or self.get_user(OWNER_ID)
+            if user is None:
+                user = await self.fetch_user(OWNER_ID)
+            # OWNER_ID never changes; keep the object so later DMs skip the REST fetch.
+            self._owner_user = user
             if user:
                 await user.send(content)
                 return True
@@ -302,19 +501,7 @@ class SanitizerBot(discord.Client):
         return False
 
     def _parse_bypass_role_list(self, raw: str) -> list[int]:
-        tokens = [t for t in re.split(r"[\s,]+", (raw or "").strip()) if t]
-        if not tokens:
-            return []
-        ids: list[int] = []
-        for tok in tokens:
-            try:
-                match = re.search(r"\d+", tok)
-                if not match:
-                    raise ValueError("No role id found")
-                ids.append(int(match.group(0)))
-            except Exception as e:
-                raise ValueError(f"Invalid role id: {tok}") from e
-        return ids
+        return list(_parse_role_ids(raw or ""))
 
     def _get_bypass_role_list(self, settings: GuildSettings) -> list[int]:
         raw = getattr(settings, "bypass_role_id", None)
@@ -325,6 +512,15 @@ class SanitizerBot(discord.Client):
         except Exception:
             return []
 
+    async def _load_settings(self, guild_id: int) -> GuildSettings:
+        """Return stored settings for a guild, falling back to defaults on DB failure."""
+        if self.db:
+            try:
+                return await self.db.get_settings(guild_id)
+            except Exception as e:
+                log.debug("Failed to get settings for guild %s: %s", guild_id, e)
+        return GuildSettings(guild_id)
+
     def _register_all_commands(self):
         register_all_commands(self)
 
@@ -340,8 +536,7 @@ class SanitizerBot(discord.Client):
         except Exception:
             pass
         try:
-            await self.tree.sync()
-            log.info("[STATUS] Slash commands synced globally on startup.")
+            await self._sync_commands_if_changed()
         except Exception as e:
             log.warning("Failed to sync app commands on startup: %s", e)
             self._config_error = True
@@ -363,6 +558,39 @@ class SanitizerBot(discord.Client):
                     e,
                 )
 
+    async def _sync_commands_if_changed(self) -> None:
+        """Sync global slash commands unless the same definitions were synced before.
+
+        The hash of the command payload is kept in bot_meta after each successful
+        sync, so a plain restart skips Discord's heavily rate-limited bulk upsert.
+        FORCE_COMMAND_SYNC ignores the stored hash for commands changed outside the bot.
+        """
+        payload = [c.to_dict(self.tree) for c in self.tree.get_commands()]
+        digest = hashlib.sha256(
+            json.dumps([APPLICATION_ID, payload], sort_keys=True, default=str).encode()
+        ).hexdigest()
+        stored = None
+        if self.db:
+            try:
+                # Both are idempotent; on_ready calls them again.
+                await self.db.connect()
+                await self.db.init()
+                stored = await self.db.get_meta(_COMMANDS_HASH_KEY)
+            except Exception as e:
+                log.debug("Could not read the stored command hash: %s", e)
+        if FORCE_COMMAND_SYNC:
+            log.info("[STATUS] FORCE_COMMAND_SYNC is set; syncing slash commands.")
+        elif stored == digest:
+            log.info("[STATUS] Slash commands unchanged since last sync; skipping.")
+            return
+        await self.tree.sync()
+        log.info("[STATUS] Slash commands synced globally on startup.")
+        if self.db:
+            try:
+                await self.db.set_meta(_COMMANDS_HASH_KEY, digest)
+            except Exception as e:
+                log.debug("Could not store the command hash: %s", e)
+
     async def on_ready(self):
         await on_ready(self)
 
@@ -375,6 +603,9 @@ class SanitizerBot(discord.Client):
     async def on_member_join(self, member: discord.Member):
         await on_member_join(self, member)
 
+    async def on_guild_channel_delete(self, channel: discord.abc.GuildChannel):
+        await on_guild_channel_delete(self, channel)
+
     async def on_message(self, message: discord.Message):
         await on_message(self, message)
 
@@ -383,17 +614,21 @@ class SanitizerBot(discord.Client):
         member: discord.Member,
         source: str,
         ignore_disabled: bool = False,
+        cooldowns: Optional[dict[int, float]] = None,
+        edited_ids: Optional[list[int]] = None,
     ) -> bool:
+        """Sanitize one member's nickname; returns True when it was changed.
+
+        cooldowns, when given, is a prefetched {user_id: timestamp} map (see
+        Database.get_cooldowns) used instead of a per-member cooldown query.
+        edited_ids, when given, collects edited member IDs so the caller can
+        store their cooldowns in one write (see Database.set_cooldowns).
+        """
         # Don't sanitize if a configuration error is active
         if self._config_error:
             return False
 
-        settings = GuildSettings(member.guild.id)
-        if self.db:
-            try:
-                settings = await self.db.get_settings(member.guild.id)
-            except Exception as e:
-                log.debug("Failed to get settings for guild %s: %s", member.guild.id, e)
+        settings = await self._load_settings(member.guild.id)
 
         if member.bot:
             if self.user and member.id == self.user.id:
@@ -405,23 +640,9 @@ class SanitizerBot(discord.Client):
             return False
 
         bypass_ids = self._get_bypass_role_list(settings)
-        if bypass_ids and any(r.id in bypass_ids for r in getattr(member, "roles", [])):
+        if bypass_ids and _has_any_role(member, bypass_ids):
             return False
 
-        if self.db:
-            try:
-                last_ts = await self.db.get_cooldown(member.id)
-            except Exception as e:
-                last_ts = None
-                log.debug(
-                    "Failed to load cooldown for user %s in guild %s: %s",
-                    member.id,
-                    member.guild.id,
-                    e,
-                )
-            if last_ts is not None and now() - last_ts < settings.cooldown_seconds:
-                return False
-
         name_now = member.nick or getattr(member, "global_name", None) or member.name
         candidate, used_fallback = sanitize_name(name_now, settings)
 
@@ -457,6 +678,25 @@ class SanitizerBot(discord.Client):
         target_nick = candidate.strip() or None
         if target_nick == member.nick:
             return False
+
+        # The cooldown only matters once an edit is due, so compliant members
+        # never wait on the cooldown lookup.
+        last_ts = None
+        if cooldowns is not None:
+            last_ts = cooldowns.get(member.id)
+        elif self.db:
+            try:
+                last_ts = await self.db.get_cooldown(member.id)
+            except Exception as e:
+                log.debug(
+                    "Failed to load cooldown for user %s in guild %s: %s",
+                    member.id,
+                    member.guild.id,
+                    e,
+                )
+        if last_ts is not None and now() - last_ts < settings.cooldown_seconds:
+            return False
+
         target_nick_display = target_nick if target_nick is not None else "<cleared>"
 
         guild = member.guild
@@ -481,41 +721,28 @@ class SanitizerBot(discord.Client):
             await member.edit(
                 nick=target_nick, reason=f"Name Sanitized by NNSB due to {source}"
             )
-            if self.db:
-                try:
-                    await self.db.set_cooldown(member.id, now())
-                except Exception as e:
-                    log.debug(
-                        "Failed to store cooldown for user %s in guild %s: %s",
-                        member.id,
-                        member.guild.id,
-                        e,
-                    )
             log.info(
                 "Edited nickname: %s -> %s [%s]",
                 name_now,
                 target_nick_display,
                 source,
             )
-
+            # The edit is what callers wait for; the cooldown write and the log
+            # post finish in the background.
+            if edited_ids is not None:
+                edited_ids.append(member.id)
+            elif self.db:
+                self._spawn_background(self._store_cooldown(member))
             if settings.logging_channel_id:
-                ch = member.guild.get_channel(settings.logging_channel_id)
-                if ch is None:
-                    try:
-                        ch = await member.guild.fetch_channel(
-                            settings.logging_channel_id
-                        )
-                    except Exception:
-                        ch = None
-                if isinstance(ch, (discord.TextChannel, discord.Thread)):
-                    try:
-                        log_msg = f"Nickname updated: {member.mention} - `{name_now}` -> `{target_nick_display}` (via {source})"
-                        # Append outdated warning if available
-                        if self._outdated_message:
-                            log_msg += f"\n\n{self._outdated_message}"
-                        await ch.send(log_msg)  # type: ignore
-                    except Exception:
-                        pass
+                log_msg = f"Nickname updated: {member.mention} - `{name_now}` -> `{target_nick_display}` (via {source})"
+                # Append outdated warning if available
+                if self._outdated_message:
+                    log_msg += f"\n\n{self._outdated_message}"
+                self._spawn_background(
+                    self._post_to_log_channel(
+                        member.guild, settings.logging_channel_id, log_msg
+                    )
+                )
             return True
         except discord.Forbidden:
             log.debug("Forbidden editing nickname for %s.", member)
@@ -523,6 +750,33 @@ class SanitizerBot(discord.Client):
             log.debug("HTTPException editing %s: %s", member, e)
         return False
 
+    def _spawn_background(self, coro) -> None:
+        """Run a coroutine without awaiting it, keeping a reference until it finishes."""
+        task = asyncio.create_task(coro)
+        self._background_tasks.add(task)
+        task.add_done_callback(self._background_tasks.discard)
+
+    async def _store_cooldown(self, member: discord.Member) -> None:
+        try:
+            await self.db.set_cooldown(member.id, now())
+        except Exception as e:
+            log.debug(
+                "Failed to store cooldown for user %s in guild %s: %s",
+                member.id,
+                member.guild.id,
+                e,
+            )
+
+    async def _post_to_log_channel(
+        self, guild: discord.Guild, ch_id: int, content: str
+    ) -> None:
+        ch = await self._get_log_channel(guild, ch_id)
+        if ch is not None:
+            try:
+                await ch.send(content)  # type: ignore
+            except Exception:
+                pass
+
     async def _diagnose_sanitize_blockers(
         self,
         member: discord.Member,
@@ -544,10 +798,9 @@ class SanitizerBot(discord.Client):
 
         # Bypass role
         bypass_ids = self._get_bypass_role_list(settings)
-        if bypass_ids and any(r.id in bypass_ids for r in getattr(member, "roles", [])):
-            mentions = ", ".join(f"<@&{rid}>" for rid in bypass_ids)
+        if bypass_ids and _has_any_role(member, bypass_ids):
             reasons.append(
-                f"Target has at least one of the following bypass role(s) {mentions}, so changes are skipped."
+                f"Target has at least one of the following bypass role(s) {_role_mentions(bypass_ids)}, so changes are skipped."
             )
 
         # Cooldown
@@ -571,7 +824,7 @@ class SanitizerBot(discord.Client):
             )
             try:
                 if settings.check_length and settings.check_length > 0:
-                    clusters = re.findall(r"\X", name_now)
+                    clusters = _GRAPHEME.findall(name_now)
                     if settings.check_length < len(clusters):
                         tail = "".join(clusters[settings.check_length :])
                         processed_tail = remove_marks_and_controls(tail)
@@ -579,7 +832,9 @@ class SanitizerBot(discord.Client):
                             processed_tail, settings.sanitize_emoji
                         )
                         if not settings.preserve_spaces:
-                            processed_tail = re.sub(r"\s+", " ", processed_tail).strip()
+                            processed_tail = _WHITESPACE_RUN.sub(
+                                " ", processed_tail
+                            ).strip()
                         if processed_tail != tail:
                             reasons.append(
                                 f"Tail beyond the first {settings.check_length} grapheme(s) contains characters that would be sanitized, but check_length limits scope. Increase check_length to sanitize them."
@@ -621,6 +876,9 @@ class SanitizerBot(discord.Client):
             except Exception as e:
                 log.debug("[STATUS] Failed cancelling status cycle task: %s", e)
         self._status_cycle_task = None
+        # Let pending cooldown writes reach the database before the pool closes.
+        if self._background_tasks:
+            await asyncio.gather(*self._background_tasks, return_exceptions=True)
         if self.db:
             try:
                 await self.db.close()
@@ -634,15 +892,10 @@ class SanitizerBot(discord.Client):
     async def _is_bot_admin(self, guild_id: int, user_id: int) -> bool:
         return await is_bot_admin(self, guild_id, user_id)
 
+    @_requires(config=True)
     async def cmd_enable_sanitizer(
         self, interaction: discord.Interaction, server_id: Optional[str] = None
     ):
-        if self._config_error:
-            await interaction.response.send_message(
-                "The bot is currently disabled due to configuration issue(s). Please contact the bot owner.",
-                ephemeral=True,
-            )
-            return
         target_gid = await resolve_target_guild(interaction, server_id)
         if target_gid is None:
             return
@@ -663,15 +916,10 @@ class SanitizerBot(discord.Client):
             f"Sanitizer enabled for server {g.name} ({g.id}).", ephemeral=True
         )
 
+    @_requires(config=True)
     async def cmd_disable_sanitizer(
         self, interaction: discord.Interaction, server_id: Optional[str] = None
     ):
-        if self._config_error:
-            await interaction.response.send_message(
-                "The bot is currently disabled due to configuration issue(s). Please contact the bot owner.",
-                ephemeral=True,
-            )
-            return
         target_gid = await resolve_target_guild(interaction, server_id)
         if target_gid is None:
             return
@@ -691,37 +939,20 @@ class SanitizerBot(discord.Client):
             f"Sanitizer disabled for server {g.name} ({g.id}).", ephemeral=True
         )
 
+    @_requires(config=True, guild=True)
     async def cmd_sanitize(
         self, interaction: discord.Interaction, member: discord.Member
     ):
-        if self._config_error:
-            await interaction.response.send_message(
-                "The bot is currently disabled due to configuration issue(s). Please contact the bot owner.",
-                ephemeral=True,
-            )
-            return
-
-        if not interaction.guild:
-            await interaction.response.send_message(
-                "This command can only be used in a server.", ephemeral=True
-            )
-            return
-
-        settings = GuildSettings(interaction.guild.id)
-        if self.db:
-            try:
-                settings = await self.db.get_settings(interaction.guild.id)
-            except Exception:
-                pass
-        warn_disabled = None
-        if not settings.enabled:
-            warn_disabled = "Note: The sanitizer is currently disabled in this server. Automatic enforcement is paused until an admin runs `/enable-sanitizer`."
+        # Settings, the nickname edit and the blocker diagnosis can outlast the
+        # 3-second response window, so acknowledge first.
+        await interaction.response.defer(ephemeral=True)
+        settings = await self._load_settings(interaction.guild.id)
 
         if not (
             self._is_guild_admin(interaction.user)
             or await self._is_bot_admin(interaction.guild.id, interaction.user.id)
         ):
-            await interaction.response.send_message(
+            await interaction.followup.send(
                 "You must have the Manage Nicknames permission or be a bot admin to use this command.",
                 ephemeral=True,
             )
@@ -756,8 +987,7 @@ class SanitizerBot(discord.Client):
                 candidate = fallback_candidate if not fallback_used else "Illegal Name"
 
         if candidate == current_name:
-            full_settings = GuildSettings(**{**settings.__dict__})
-            full_settings.check_length = 0
+            full_settings = dataclasses.replace(settings, check_length=0)
             candidate_full, _candidate_full_fallback = sanitize_name(
                 current_name, full_settings
             )
@@ -769,9 +999,8 @@ class SanitizerBot(discord.Client):
                 )
             else:
                 msg = f"No change needed for {member.mention}; nickname already compliant."
-            if warn_disabled:
-                msg = f"{msg}\n{warn_disabled}"
-            await interaction.response.send_message(msg, ephemeral=True)
+            msg = _with_warn(msg, settings.enabled, _WARN_ENFORCEMENT_PAUSED)
+            await interaction.followup.send(msg, ephemeral=True)
             return
 
         did_change = await self._sanitize_member(
@@ -789,25 +1018,16 @@ class SanitizerBot(discord.Client):
                 msg = f"Couldn't change nickname from `{current_name}` to `{candidate}` because:\n{bullets}"
             else:
                 msg = f"Attempted to update nickname from `{current_name}` to `{candidate}`, but no change was applied. The Discord API may have refused the edit (Forbidden/HTTP error)."
-        if warn_disabled:
-            msg = f"{msg}\n{warn_disabled}"
-        await interaction.response.send_message(msg, ephemeral=True)
+        msg = _with_warn(msg, settings.enabled, _WARN_ENFORCEMENT_PAUSED)
+        await interaction.followup.send(msg, ephemeral=True)
 
+    @_requires(config=True, guild=True)
     async def cmd_sweep_now(self, interaction: discord.Interaction):
-        if self._config_error:
-            await interaction.response.send_message(
-                "The bot is currently disabled due to configuration issue(s). Please contact the bot owner.",
-                ephemeral=True,
-            )
-            return
-        if not interaction.guild:
-            await interaction.response.send_message(
-                "This command can only be used in a server.", ephemeral=True
-            )
-            return
+        # Acknowledge before the admin and settings lookups; a cold pool can be slow.
+        await interaction.response.defer(ephemeral=True)
         # Admin check (bot admin only)
         if not await self._is_bot_admin(interaction.guild.id, interaction.user.id):
-            await interaction.response.send_message(
+            await interaction.followup.send(
                 "Only bot admins can use this command.",
                 ephemeral=True,
             )
@@ -815,24 +1035,41 @@ class SanitizerBot(discord.Client):
         # Check settings enabled
         settings = await self.db.get_settings(interaction.guild.id)
         if not settings.enabled:
-            await interaction.response.send_message(
+            await interaction.followup.send(
                 "The sanitizer is currently disabled in this server. Enable it with `/enable-sanitizer`.",
                 ephemeral=True,
             )
             return
-        # Defer while sweeping
-        await interaction.response.defer(ephemeral=True)
         if self._sweep_running:
             await interaction.followup.send(
                 "A sweep is already running (scheduled or manual). Try again after it finishes.",
                 ephemeral=True,
             )
             return
+        last_report = now_mono()
+
+        async def _report_progress(processed: int, changed: int):
+            # Edit the deferred reply in place rather than posting one message per update.
+            nonlocal last_report
+            if now_mono() - last_report < _SWEEP_PROGRESS_INTERVAL_SEC:
+                return
+            last_report = now_mono()
+            try:
+                await interaction.edit_original_response(
+                    content=f"Sweep in progress. Processed {processed} member(s); changed {changed} nickname(s) so far."
+                )
+            except Exception as e:
+                log.debug("Failed to update sweep progress: %s", e)
+
         self._sweep_running = True
         try:
             async with self._sweep_lock:
                 processed, changed, sweep_error = await sweep_guild_members(
-                    self, interaction.guild, settings, source="manual-sweep"
+                    self,
+                    interaction.guild,
+                    settings,
+                    source="manual-sweep",
+                    on_progress=_report_progress,
                 )
         finally:
             self._sweep_running = False
@@ -885,6 +1122,7 @@ class SanitizerBot(discord.Client):
     async def _command_cooldown_check(self, interaction: discord.Interaction) -> bool:
         return await command_cooldown_check(self, interaction)
 
+    @_requires(config=True)
     async def cmd_set_setting(
         self,
         interaction: discord.Interaction,
@@ -893,12 +1131,6 @@ class SanitizerBot(discord.Client):
         pairs: Optional[str] = None,
         server_id: Optional[str] = None,
     ):
-        if self._config_error:
-            await interaction.response.send_message(
-                "The bot is currently disabled due to configuration issue(s). Please contact the bot owner.",
-                ephemeral=True,
-            )
-            return
         target_gid = await resolve_target_guild(interaction, server_id)
         if target_gid is None:
             return
@@ -922,38 +1154,6 @@ class SanitizerBot(discord.Client):
         settings = await self.db.get_settings(target_gid)
         current_min_len = int(getattr(settings, "min_nick_length", MIN_NICK_LENGTH))
         current_max_len = int(getattr(settings, "max_nick_length", MAX_NICK_LENGTH))
-        warn_disabled = None
-        if not settings.enabled:
-            warn_disabled = "Note: The sanitizer is currently disabled in this server. Changes will apply after a bot admin runs `/enable-sanitizer`."
-
-        key_alias = {
-            "enabled": "enabled",
-            "check_length": "check_length",
-            "min_nick_length": "min_nick_length",
-            "max_nick_length": "max_nick_length",
-            "cooldown_seconds": "cooldown_seconds",
-            "preserve_spaces": "preserve_spaces",
-            "sanitize_emoji": "sanitize_emoji",
-            "enforce_bots": "enforce_bots",
-            "logging_channel_id": "logging_channel_id",
-            "bypass_role_id": "bypass_role_id",
-            "fallback_mode": "fallback_mode",
-            "fallback_label": "fallback_label",
-        }
-        allowed_user_keys = {
-            "enabled",
-            "preserve_spaces",
-            "sanitize_emoji",
-            "enforce_bots",
-            "check_length",
-            "min_nick_length",
-            "max_nick_length",
-            "cooldown_seconds",
-            "logging_channel_id",
-            "bypass_role_id",
-            "fallback_mode",
-            "fallback_label",
-        }
 
         def _unquote(s: str) -> str:
             s = (s or "").strip()
@@ -976,74 +1176,16 @@ class SanitizerBot(discord.Client):
             will_enable = False
             errors = []
             pending_updates: dict[str, object] = {}
-            update_order: list[str] = []
             for tok in tokens:
                 k, v_raw = tok.split("=", 1)
-                raw_k = k.strip().lower()
-                if raw_k not in allowed_user_keys:
-                    errors.append(f"Unsupported key: {raw_k}")
+                k = k.strip().lower()
+                if k not in _ALLOWED_USER_KEYS:
+                    errors.append(f"Unsupported key: {k}")
                     continue
-                k = key_alias.get(raw_k, raw_k)
                 v_raw = _unquote(v_raw.strip())
                 try:
-                    if k in {
-                        "check_length",
-                        "min_nick_length",
-                        "max_nick_length",
-                        "cooldown_seconds",
-                    }:
-                        v = int(v_raw)
-                        if k == "check_length":
-                            v = max(0, v)
-                        if k == "min_nick_length":
-                            v = min(8, max(0, v))
-                        if k == "max_nick_length":
-                            v = min(32, max(1, v))
-                        if k == "cooldown_seconds":
-                            v = max(0, v)
-                    elif k in {
-                        "preserve_spaces",
-                        "sanitize_emoji",
-                        "enforce_bots",
-                        "enabled",
-                    }:
-                        v = parse_bool_strict(v_raw)
-                    elif k == "logging_channel_id":
-                        v = (
-                            int(v_raw)
-                            if v_raw.lower() not in {"none", "null", "unset"}
-                            else None
-                        )
-                    elif k == "bypass_role_id":
-                        if v_raw.lower() in {"none", "null", "unset"}:
-                            v = None
-                        else:
-                            v = self._parse_bypass_role_list(v_raw)
-                    elif k == "fallback_label":
-                        lab = v_raw.strip()
-                        if lab.lower() in {"none", "null", "unset"}:
-                            v = None
-                        else:
-                            if not (1 <= len(lab) <= 20) or not re.fullmatch(
-                                r"[A-Za-z0-9 \-]+", lab
-                            ):
-                                raise ValueError(
-                                    "fallback_label must be 1-20 characters: letters, numbers, spaces, or dashes"
-                                )
-                            v = lab
-                    elif k == "fallback_mode":
-                        mv = v_raw.strip().lower()
-                        if mv not in {"default", "randomized", "static"}:
-                            raise ValueError(
-                                "fallback_mode must be one of: default, randomized, static"
-                            )
-                        v = mv
-                    else:
-                        errors.append(f"Unsupported key: {k}")
-                        continue
+                    v = _SETTING_DISPATCH[k][1](self, v_raw)
                     pending_updates[k] = v
-                    if k not in update_order:
-                        update_order.append(k)
                 except Exception as e:
                     errors.append(f"{k}: {e}")
 
@@ -1073,40 +1215,15 @@ class SanitizerBot(discord.Client):
                             f"max_nick_length ({proposed_max}) cannot be less than min_nick_length ({proposed_min})"
                         )
                         pending_updates.pop("max_nick_length", None)
-                    update_order = [k for k in update_order if k in pending_updates]
 
-            if (
-                "min_nick_length" in pending_updates
-                and "max_nick_length" in pending_updates
-            ):
-                min_v = int(pending_updates["min_nick_length"])
-                max_v = int(pending_updates["max_nick_length"])
-                try:
-                    await self.db.set_min_max_lengths(target_gid, min_v, max_v)
-                    if update_order.index("min_nick_length") < update_order.index(
-                        "max_nick_length"
-                    ):
-                        updated.append(f"min_nick_length={min_v}")
-                        updated.append(f"max_nick_length={max_v}")
-                    else:
-                        updated.append(f"max_nick_length={max_v}")
-                        updated.append(f"min_nick_length={min_v}")
-                except Exception as e:
-                    errors.append(f"min_nick_length/max_nick_length: {e}")
-                pending_updates.pop("min_nick_length", None)
-                pending_updates.pop("max_nick_length", None)
-
-            for k in update_order:
-                if k not in pending_updates:
-                    continue
-                v = pending_updates[k]
+            # Apply every accepted update in one transaction.
+            if pending_updates:
                 try:
-                    await self.db.set_setting(target_gid, k, v)
-                    if k == "enabled" and bool(v) is True:
-                        will_enable = True
-                    updated.append(f"{k}={v}")
+                    await self.db.set_settings_bulk(target_gid, pending_updates)
+                    updated.extend(f"{k}={v}" for k, v in pending_updates.items())
+                    will_enable = bool(pending_updates.get("enabled", False))
                 except Exception as e:
-                    errors.append(f"{k}: {e}")
+                    errors.append(f"{', '.join(pending_updates)}: {e}")
 
             msg = []
             if updated:
@@ -1114,8 +1231,7 @@ class SanitizerBot(discord.Client):
             if errors:
                 msg.append("Errors: " + "; ".join(errors))
             text = "\n".join(msg) if msg else "No changes."
-            if warn_disabled and not will_enable:
-                text = f"{text}\n{warn_disabled}"
+            text = _with_warn(text, settings.enabled or will_enable)
             await interaction.response.send_message(text, ephemeral=True)
             return
 
@@ -1125,115 +1241,30 @@ class SanitizerBot(discord.Client):
                 ephemeral=True,
             )
             return
-        raw_key = key.lower()
-        if raw_key not in allowed_user_keys:
+        key = key.lower()
+        if key not in _ALLOWED_USER_KEYS:
             await interaction.response.send_message(
                 "Unsupported setting.", ephemeral=True
             )
             return
-        key = key_alias.get(raw_key, raw_key)
 
         if value is None:
-            s = await self.db.get_settings(target_gid)
-            if key == "check_length":
-                cur = s.check_length
-            elif key == "min_nick_length":
-                cur = s.min_nick_length
-            elif key == "max_nick_length":
-                cur = s.max_nick_length
-            elif key == "preserve_spaces":
-                cur = s.preserve_spaces
-            elif key == "cooldown_seconds":
-                cur = s.cooldown_seconds
-            elif key == "sanitize_emoji":
-                cur = s.sanitize_emoji
-            elif key == "enforce_bots":
-                cur = s.enforce_bots
-            elif key == "fallback_mode":
-                cur = getattr(s, "fallback_mode", "default")
-            elif key == "enabled":
-                cur = s.enabled
-            elif key == "logging_channel_id":
-                cur = s.logging_channel_id
-            elif key == "bypass_role_id":
-                cur = self._get_bypass_role_list(s)
-            elif key == "fallback_label":
-                cur = s.fallback_label or "Illegal Name"
-            else:
-                await interaction.response.send_message(
-                    "Unsupported setting.", ephemeral=True
-                )
-                return
+            cur = _SETTING_DISPATCH[key][0](self, settings)
             if key == "bypass_role_id":
                 cur_display = ",".join(str(rid) for rid in cur) if cur else "None"
                 text = f"Current {key}: {cur_display}"
             else:
                 text = f"Current {key}: {cur}"
-            if warn_disabled:
-                text = f"{text}\n{warn_disabled}"
+            text = _with_warn(text, settings.enabled)
             await interaction.response.send_message(text, ephemeral=True)
             return
         try:
-            if value is not None:
-                value = _unquote(value)
-            if key in {
-                "check_length",
-                "min_nick_length",
-                "max_nick_length",
-                "cooldown_seconds",
-            }:
-                v = int(value)
-                if key == "check_length":
-                    v = max(0, v)
-                if key == "min_nick_length":
-                    v = min(8, max(0, v))
-                if key == "max_nick_length":
-                    v = min(32, max(1, v))
-                if key == "cooldown_seconds":
-                    v = max(0, v)
-            elif key in {
-                "preserve_spaces",
-                "sanitize_emoji",
-                "enforce_bots",
-                "enabled",
-            }:
-                v = parse_bool_strict(value)
-            elif key == "fallback_mode":
-                mv = value.strip().lower()
-                if mv not in {"default", "randomized", "static"}:
-                    raise ValueError(
-                        "fallback_mode must be one of: default, randomized, static"
-                    )
-                v = mv
-            elif key == "logging_channel_id":
-                v = (
-                    int(value)
-                    if value.strip().lower() not in {"none", "null", "unset"}
-                    else None
-                )
-            elif key == "bypass_role_id":
-                if value.strip().lower() in {"none", "null", "unset"}:
-                    v = None
-                else:
-                    v = self._parse_bypass_role_list(value)
-            elif key == "fallback_label":
-                lab = value.strip()
-                if lab.lower() in {"none", "null", "unset"}:
-                    v = None
-                else:
-                    if not (1 <= len(lab) <= 20) or not re.fullmatch(
-                        r"[A-Za-z0-9 \-]+", lab
-                    ):
-                        await interaction.response.send_message(
-                            "fallback_label must be 1-20 characters: letters, numbers, spaces, or dashes.",
-                            ephemeral=True,
-                        )
-                        return
-                    v = lab
-            else:
-                await interaction.response.send_message(
-                    "Unsupported setting.", ephemeral=True
-                )
+            try:
+                v = _SETTING_DISPATCH[key][1](self, _unquote(value))
+            except ValueError as e:
+                if key != "fallback_label":
+                    raise
+                await interaction.response.send_message(f"{e}.", ephemeral=True)
                 return
 
             if key == "min_nick_length" and int(v) > current_max_len:
@@ -1258,7 +1289,7 @@ class SanitizerBot(discord.Client):
                     ids = [int(x) for x in v]
                 else:
                     ids = self._parse_bypass_role_list(str(v)) if v else []
-                display = ", ".join(f"<@&{rid}>" for rid in ids) if ids else "None"
+                display = _role_mentions(ids) if ids else "None"
             elif isinstance(v, bool):
                 display = "True" if v else "False"
             elif isinstance(v, str) or v is None:
@@ -1267,207 +1298,118 @@ class SanitizerBot(discord.Client):
                 display = str(v)
             text = f"Updated {key} to {display}."
             # Suppress the disabled warning if this operation enabled the bot
-            if warn_disabled and not (
-                key == "enabled" and isinstance(v, bool) and v is True
-            ):
-                text = f"{text}\n{warn_disabled}"
+            text = _with_warn(
+                text, settings.enabled or (key == "enabled" and v is True)
+            )
             await interaction.response.send_message(text, ephemeral=True)
         except Exception as e:
             await interaction.response.send_message(
                 f"Failed to update setting: {e}", ephemeral=True
             )
 
+    @_requires(config=True, guild=True, admin=True)
     async def cmd_set_enforce_bots(
         self, interaction: discord.Interaction, value: Optional[bool] = None
     ):
-        if self._config_error:
-            await interaction.response.send_message(
-                "The bot is currently disabled due to configuration issue(s). Please contact the bot owner.",
-                ephemeral=True,
-            )
-            return
-        if not interaction.guild:
-            await interaction.response.send_message(
-                "This command can only be used in a server.", ephemeral=True
-            )
-            return
-        if not await self._is_bot_admin(interaction.guild.id, interaction.user.id):
-            await interaction.response.send_message(
-                "Only bot admins can modify settings.", ephemeral=True
-            )
-            return
         s = await self.db.get_settings(interaction.guild.id)
-        warn_disabled = None
-        if not s.enabled:
-            warn_disabled = "Note: The sanitizer is currently disabled in this server. Changes will apply after a bot admin runs `/enable-sanitizer`."
         if value is None:
             text = f"Current enforce_bots: {s.enforce_bots}"
-            if warn_disabled:
-                text = f"{text}\n{warn_disabled}"
+            text = _with_warn(text, s.enabled)
             await interaction.response.send_message(text, ephemeral=True)
             return
         await self.db.set_setting(interaction.guild.id, "enforce_bots", bool(value))
         text = f"enforce_bots set to {bool(value)}."
-        if warn_disabled:
-            text = f"{text}\n{warn_disabled}"
+        text = _with_warn(text, s.enabled)
         await interaction.response.send_message(text, ephemeral=True)
 
+    @_requires(guild=True)
     async def cmd_set_check_count(
         self, interaction: discord.Interaction, value: Optional[int] = None
     ):
-        if not interaction.guild:
-            await interaction.response.send_message(
-                "This command can only be used in a server.", ephemeral=True
-            )
-            return
         if value is None:
             s = await self.db.get_settings(interaction.guild.id)  # type: ignore
-            warn_disabled = None
-            if not s.enabled:
-                warn_disabled = "Note: The sanitizer is currently disabled in this server. Changes will apply after a bot admin runs `/enable-sanitizer`."
             text = f"Current check_length: {s.check_length}"
-            if warn_disabled:
-                text = f"{text}\n{warn_disabled}"
+            text = _with_warn(text, s.enabled)
             await interaction.response.send_message(text, ephemeral=True)
             return
         await self.cmd_set_setting(interaction, "check_length", str(value))
 
+    @_requires(guild=True)
     async def cmd_set_min_nick_length(
         self, interaction: discord.Interaction, value: Optional[int] = None
     ):
-        if not interaction.guild:
-            await interaction.response.send_message(
-                "This command can only be used in a server.", ephemeral=True
-            )
-            return
         if value is None:
             s = await self.db.get_settings(interaction.guild.id)  # type: ignore
-            warn_disabled = None
-            if not s.enabled:
-                warn_disabled = "Note: The sanitizer is currently disabled in this server. Changes will apply after a bot admin runs `/enable-sanitizer`."
             text = f"Current min_nick_length: {s.min_nick_length}"
-            if warn_disabled:
-                text = f"{text}\n{warn_disabled}"
+            text = _with_warn(text, s.enabled)
             await interaction.response.send_message(text, ephemeral=True)
             return
         await self.cmd_set_setting(interaction, "min_nick_length", str(value))
 
+    @_requires(guild=True)
     async def cmd_set_max_nick_length(
         self, interaction: discord.Interaction, value: Optional[int] = None
     ):
-        if not interaction.guild:
-            await interaction.response.send_message(
-                "This command can only be used in a server.", ephemeral=True
-            )
-            return
         if value is None:
             s = await self.db.get_settings(interaction.guild.id)  # type: ignore
-            warn_disabled = None
-            if not s.enabled:
-                warn_disabled = "Note: The sanitizer is currently disabled in this server. Changes will apply after a bot admin runs `/enable-sanitizer`."
             text = f"Current max_nick_length: {s.max_nick_length}"
-            if warn_disabled:
-                text = f"{text}\n{warn_disabled}"
+            text = _with_warn(text, s.enabled)
             await interaction.response.send_message(text, ephemeral=True)
             return
         await self.cmd_set_setting(interaction, "max_nick_length", str(value))
 
+    @_requires(guild=True)
     async def cmd_set_keep_spaces(
         self, interaction: discord.Interaction, value: Optional[bool] = None
     ):
-        if not interaction.guild:
-            await interaction.response.send_message(
-                "This command can only be used in a server.", ephemeral=True
-            )
-            return
         if value is None:
             s = await self.db.get_settings(interaction.guild.id)  # type: ignore
-            warn_disabled = None
-            if not s.enabled:
-                warn_disabled = "Note: The sanitizer is currently disabled in this server. Changes will apply after a bot admin runs `/enable-sanitizer`."
             text = f"Current preserve_spaces: {s.preserve_spaces}"
-            if warn_disabled:
-                text = f"{text}\n{warn_disabled}"
+            text = _with_warn(text, s.enabled)
             await interaction.response.send_message(text, ephemeral=True)
             return
         await self.cmd_set_setting(
             interaction, "preserve_spaces", "True" if value else "False"
         )
 
+    @_requires(guild=True)
     async def cmd_set_cooldown_seconds(
         self, interaction: discord.Interaction, value: Optional[int] = None
     ):
-        if not interaction.guild:
-            await interaction.response.send_message(
-                "This command can only be used in a server.", ephemeral=True
-            )
-            return
         if value is None:
             s = await self.db.get_settings(interaction.guild.id)  # type: ignore
-            warn_disabled = None
-            if not s.enabled:
-                warn_disabled = "Note: The sanitizer is currently disabled in this server. Changes will apply after a bot admin runs `/enable-sanitizer`."
             text = f"Current cooldown_seconds: {s.cooldown_seconds}"
-            if warn_disabled:
-                text = f"{text}\n{warn_disabled}"
+            text = _with_warn(text, s.enabled)
             await interaction.response.send_message(text, ephemeral=True)
             return
         await self.cmd_set_setting(interaction, "cooldown_seconds", str(value))
 
+    @_requires(guild=True)
     async def cmd_set_emoji_sanitization(
         self, interaction: discord.Interaction, value: Optional[bool] = None
     ):
-        if not interaction.guild:
-            await interaction.response.send_message(
-                "This command can only be used in a server.", ephemeral=True
-            )
-            return
         if value is None:
             s = await self.db.get_settings(interaction.guild.id)  # type: ignore
-            warn_disabled = None
-            if not s.enabled:
-                warn_disabled = "Note: The sanitizer is currently disabled in this server. Changes will apply after a bot admin runs `/enable-sanitizer`."
             text = f"Current sanitize_emoji: {s.sanitize_emoji}"
-            if warn_disabled:
-                text = f"{text}\n{warn_disabled}"
+            text = _with_warn(text, s.enabled)
             await interaction.response.send_message(text, ephemeral=True)
             return
         await self.cmd_set_setting(
             interaction, "sanitize_emoji", "True" if value else "False"
         )
 
+    @_requires(config=True, guild=True, admin=True)
     async def cmd_set_fallback_mode(
         self, interaction: discord.Interaction, mode: Optional[str] = None
     ):
-        if self._config_error:
-            await interaction.response.send_message(
-                "The bot is currently disabled due to configuration issue(s). Please contact the bot owner.",
-                ephemeral=True,
-            )
-            return
-        if not interaction.guild:
-            await interaction.response.send_message(
-                "This command can only be used in a server.", ephemeral=True
-            )
-            return
-        if not await self._is_bot_admin(interaction.guild.id, interaction.user.id):
-            await interaction.response.send_message(
-                "Only bot admins can modify settings.", ephemeral=True
-            )
-            return
         s = await self.db.get_settings(interaction.guild.id)
-        warn_disabled = None
-        if not s.enabled:
-            warn_disabled = "Note: The sanitizer is currently disabled in this server. Changes will apply after a bot admin runs `/enable-sanitizer`."
-        valid = {"default", "randomized", "static"}
         if mode is None:
             text = f"Current fallback_mode: {getattr(s, 'fallback_mode', 'default')}"
-            if warn_disabled:
-                text = f"{text}\n{warn_disabled}"
+            text = _with_warn(text, s.enabled)
             await interaction.response.send_message(text, ephemeral=True)
             return
         mval = mode.strip().lower()
-        if mval not in valid:
+        if mval not in _FALLBACK_MODES:
             await interaction.response.send_message(
                 "Invalid mode. Use one of: default, randomized, static.",
                 ephemeral=True,
@@ -1475,82 +1417,48 @@ class SanitizerBot(discord.Client):
             return
         await self.db.set_setting(interaction.guild.id, "fallback_mode", mval)
         text = f"fallback_mode set to {mval}."
-        if warn_disabled:
-            text = f"{text}\n{warn_disabled}"
+        text = _with_warn(text, s.enabled)
         await interaction.response.send_message(text, ephemeral=True)
 
+    @_requires(config=True, guild=True, admin=True)
     async def cmd_set_logging_channel(
         self,
         interaction: discord.Interaction,
         channel: Optional[discord.TextChannel] = None,
     ):
-        if self._config_error:
-            await interaction.response.send_message(
-                "The bot is currently disabled due to configuration issue(s). Please contact the bot owner.",
-                ephemeral=True,
-            )
-            return
-        if not interaction.guild:
-            await interaction.response.send_message(
-                "This command can only be used in a server.", ephemeral=True
-            )
-            return
-        if not await self._is_bot_admin(interaction.guild.id, interaction.user.id):
-            await interaction.response.send_message(
-                "Only bot admins can modify settings.", ephemeral=True
-            )
-            return
         settings = await self.db.get_settings(interaction.guild.id)
-        warn_disabled = None
-        if not settings.enabled:
-            warn_disabled = "Note: The sanitizer is currently disabled in this server. Changes will apply after a bot admin runs `/enable-sanitizer`."
         if channel is None:
             cur = settings.logging_channel_id
-            mention = f"<#{cur}>" if cur else "not set"
-            text = f"Current logging channel: {mention}"
-            if warn_disabled:
-                text = f"{text}\n{warn_disabled}"
+            text = (
+                f"Current logging channel: <#{cur}>"
+                if cur
+                else "Current logging channel: not set"
+            )
+            text = _with_warn(text, settings.enabled)
             await interaction.response.send_message(text, ephemeral=True)
             return
         await self.db.set_setting(
             interaction.guild.id, "logging_channel_id", channel.id
         )
+        if isinstance(channel, _SENDABLE_CHANNEL_TYPES):
+            self._log_channel_cache[interaction.guild.id] = channel
         text = f"Logging channel set to {channel.mention}."
-        if warn_disabled:
-            text = f"{text}\n{warn_disabled}"
+        text = _with_warn(text, settings.enabled)
         await interaction.response.send_message(text, ephemeral=True)
 
+    @_requires(config=True, guild=True, admin=True)
     async def cmd_set_bypass_role(
         self, interaction: discord.Interaction, role: Optional[str] = None
     ):
-        if self._config_error:
-            await interaction.response.send_message(
-                "The bot is currently disabled due to configuration issue(s). Please contact the bot owner.",
-                ephemeral=True,
-            )
-            return
-        if not interaction.guild:
-            await interaction.response.send_message(
-                "This command can only be used in a server.", ephemeral=True
-            )
-            return
-        if not await self._is_bot_admin(interaction.guild.id, interaction.user.id):
-            await interaction.response.send_message(
-                "Only bot admins can modify settings.", ephemeral=True
-            )
-            return
         settings = await self.db.get_settings(interaction.guild.id)
-        warn_disabled = None
-        if not settings.enabled:
-            warn_disabled = "Note: The sanitizer is currently disabled in this server. Changes will apply after a bot admin runs `/enable-sanitizer`."
         if role is None:
             cur_ids = self._get_bypass_role_list(settings)
-            mention = (
-                ", ".join(f"<@&{rid}>" for rid in cur_ids) if cur_ids else "not set"
+            text = (
+                f"Current bypass role(s): {_role_mentions(cur_ids)}"
+                if cur_ids
+                else "Current bypass role(s): not set"
             )
-            text = f"Current bypass role(s): {mention}"
-            if warn_disabled:
-                text = f"{text}\n{warn_disabled}"
+            text = _with_warn(text, settings.enabled)
             await interaction.response.send_message(text, ephemeral=True)
             return
         try:
@@ -1568,123 +1476,65 @@ class SanitizerBot(discord.Client):
             return
         normalized = ",".join(str(rid) for rid in role_ids)
         await self.db.set_setting(interaction.guild.id, "bypass_role_id", normalized)
-        mentions = ", ".join(f"<@&{rid}>" for rid in role_ids)
-        text = f"Bypass role(s) set to {mentions}."
-        if warn_disabled:
-            text = f"{text}\n{warn_disabled}"
+        text = f"Bypass role(s) set to {_role_mentions(role_ids)}."
+        text = _with_warn(text, settings.enabled)
         await interaction.response.send_message(text, ephemeral=True)
 
+    @_requires(config=True, guild=True, admin=True)
     async def cmd_clear_logging_channel(
         self, interaction: discord.Interaction, confirm: Optional[bool] = False
     ):
-        if self._config_error:
-            await interaction.response.send_message(
-                "The bot is currently disabled due to configuration issue(s). Please contact the bot owner.",
-                ephemeral=True,
-            )
-            return
-        if not interaction.guild:
-            await interaction.response.send_message(
-                "This command can only be used in a server.", ephemeral=True
-            )
-            return
-        if not await self._is_bot_admin(interaction.guild.id, interaction.user.id):
-            await interaction.response.send_message(
-                "Only bot admins can modify settings.", ephemeral=True
-            )
-            return
         if not confirm:
             await interaction.response.send_message(
                 "Confirmation required: pass confirm=True to proceed.", ephemeral=True
             )
             return
-        settings = await self.db.get_settings(interaction.guild.id)
-        warn_disabled = None
-        if not settings.enabled:
-            warn_disabled = "Note: The sanitizer is currently disabled in this server. Changes will apply after a bot admin runs `/enable-sanitizer`."
-        await self.db.set_setting(interaction.guild.id, "logging_channel_id", None)
+        enabled = await self.db.set_setting(
+            interaction.guild.id, "logging_channel_id", None
+        )
         text = "Logging channel cleared (set to default)."
-        if warn_disabled:
-            text = f"{text}\n{warn_disabled}"
+        text = _with_warn(text, enabled)
         await interaction.response.send_message(text, ephemeral=True)
 
+    @_requires(config=True, guild=True, admin=True)
     async def cmd_clear_bypass_role(
         self, interaction: discord.Interaction, confirm: Optional[bool] = False
     ):
-        if self._config_error:
-            await interaction.response.send_message(
-                "The bot is currently disabled due to configuration issue(s). Please contact the bot owner.",
-                ephemeral=True,
-            )
-            return
-        if not interaction.guild:
-            await interaction.response.send_message(
-                "This command can only be used in a server.", ephemeral=True
-            )
-            return
-        if not await self._is_bot_admin(interaction.guild.id, interaction.user.id):
-            await interaction.response.send_message(
-                "Only bot admins can modify settings.", ephemeral=True
-            )
-            return
         if not confirm:
             await interaction.response.send_message(
                 "Confirmation required: pass confirm=True to proceed.", ephemeral=True
             )
             return
-        settings = await self.db.get_settings(interaction.guild.id)
-        warn_disabled = None
-        if not settings.enabled:
-            warn_disabled = "Note: The sanitizer is currently disabled in this server. Changes will apply after a bot admin runs `/enable-sanitizer`."
-        await self.db.set_setting(interaction.guild.id, "bypass_role_id", None)
+        enabled = await self.db.set_setting(
+            interaction.guild.id, "bypass_role_id", None
+        )
         text = "Bypass role(s) cleared (set to default)."
-        if warn_disabled:
-            text = f"{text}\n{warn_disabled}"
+        text = _with_warn(text, enabled)
         await interaction.response.send_message(text, ephemeral=True)
 
+    @_requires(config=True, guild=True, admin=True)
     async def cmd_set_fallback_label(
         self, interaction: discord.Interaction, value: Optional[str] = None
     ):
-        if self._config_error:
-            await interaction.response.send_message(
-                "The bot is currently disabled due to configuration issue(s). Please contact the bot owner.",
-                ephemeral=True,
-            )
-            return
-        if not interaction.guild:
-            await interaction.response.send_message(
-                "This command can only be used in a server.", ephemeral=True
-            )
-            return
-        if not await self._is_bot_admin(interaction.guild.id, interaction.user.id):
-            await interaction.response.send_message(
-                "Only bot admins can modify settings.", ephemeral=True
-            )
-            return
         settings = await self.db.get_settings(interaction.guild.id)
-        warn_disabled = None
-        if not settings.enabled:
-            warn_disabled = "Note: The sanitizer is currently disabled in this server. Changes will apply after a bot admin runs `/enable-sanitizer`."
         if value is None:
             cur = settings.fallback_label or "Illegal Name"
             mode = getattr(settings, "fallback_mode", "default")
             text = f"Current fallback_label: {cur}"
             if mode == "randomized":
                 text += "\nNote: fallback_label is ignored while fallback_mode is set to randomized."
-            if warn_disabled:
-                text = f"{text}\n{warn_disabled}"
+            text = _with_warn(text, settings.enabled)
             await interaction.response.send_message(text, ephemeral=True)
             return
         lab = value.strip()
-        if lab.lower() in {"none", "null", "unset"}:
+        if lab.lower() in _NONE_TOKENS:
             await self.db.set_setting(interaction.guild.id, "fallback_label", None)
             text = "fallback_label cleared (set to default)."
-            if warn_disabled:
-                text = f"{text}\n{warn_disabled}"
+            text = _with_warn(text, settings.enabled)
             await interaction.response.send_message(text, ephemeral=True)
             return
 
-        if not (1 <= len(lab) <= 20) or not re.fullmatch(r"[A-Za-z0-9 \-]+", lab):
+        if not _is_valid_fallback_label(lab):
             await interaction.response.send_message(
                 "fallback_label must be 1-20 characters: letters, numbers, spaces, or dashes.",
                 ephemeral=True,
@@ -1698,49 +1548,25 @@ class SanitizerBot(discord.Client):
             text += (
                 "\nWarning: This label will be ignored while fallback_mode=randomized."
             )
-        if warn_disabled:
-            text = f"{text}\n{warn_disabled}"
+        text = _with_warn(text, settings.enabled)
         await interaction.response.send_message(text, ephemeral=True)
 
+    @_requires(config=True, guild=True, admin=True)
     async def cmd_clear_fallback_label(self, interaction: discord.Interaction):
-        if self._config_error:
-            await interaction.response.send_message(
-                "The bot is currently disabled due to configuration issue(s). Please contact the bot owner.",
-                ephemeral=True,
-            )
-            return
-        if not interaction.guild:
-            await interaction.response.send_message(
-                "This command can only be used in a server.", ephemeral=True
-            )
-            return
-        if not await self._is_bot_admin(interaction.guild.id, interaction.user.id):
-            await interaction.response.send_message(
-                "Only bot admins can modify settings.", ephemeral=True
-            )
-            return
-        settings = await self.db.get_settings(interaction.guild.id)
-        warn_disabled = None
-        if not settings.enabled:
-            warn_disabled = "Note: The sanitizer is currently disabled in this server. Changes will apply after a bot admin runs `/enable-sanitizer`."
-        await self.db.set_setting(interaction.guild.id, "fallback_label", None)
+        enabled = await self.db.set_setting(
+            interaction.guild.id, "fallback_label", None
+        )
         text = "fallback_label cleared (set to default)."
-        if warn_disabled:
-            text = f"{text}\n{warn_disabled}"
+        text = _with_warn(text, enabled)
         await interaction.response.send_message(text, ephemeral=True)
 
+    @_requires(config=True)
     async def cmd_reset_settings(
         self,
         interaction: discord.Interaction,
         server_id: Optional[str] = None,
         confirm: Optional[bool] = False,
     ):
-        if self._config_error:
-            await interaction.response.send_message(
-                "The bot is currently disabled due to configuration issue(s). Please contact the bot owner.",
-                ephemeral=True,
-            )
-            return
         target_gid = await resolve_target_guild(interaction, server_id)
         if target_gid is None:
             return
@@ -1791,20 +1617,10 @@ class SanitizerBot(discord.Client):
             f"Reset settings to defaults {scope_note}. {note}", ephemeral=True
         )
 
+    @_requires(config=True, owner=True)
     async def cmd_global_reset_settings(
         self, interaction: discord.Interaction, confirm: Optional[bool] = False
     ):
-        if self._config_error:
-            await interaction.response.send_message(
-                "The bot is currently disabled due to configuration issue(s). Please contact the bot owner.",
-                ephemeral=True,
-            )
-            return
-        if not OWNER_ID or interaction.user.id != OWNER_ID:
-            await interaction.response.send_message(
-                "Only the bot owner can perform this action.", ephemeral=True
-            )
-            return
         if not confirm:
             await interaction.response.send_message(
                 "Confirmation required: pass confirm=True to proceed.", ephemeral=True
@@ -1812,29 +1628,27 @@ class SanitizerBot(discord.Client):
             return
         if not await owner_destructive_check(self, interaction):
             return
-        # First, attempt to notify configured logging channels in all guilds
-        sent = 0
-        try:
-            sent = await self._broadcast_to_log_channels(
-                f"Global action by owner {interaction.user.mention}: All bot settings will be reset to defaults across all servers. You **_WILL_** need to re-set them."
-            )
-            if sent:
-                log.info("Broadcasted pre-reset alert to %d guild(s).", sent)
-        except Exception as e:
-            log.debug("Failed to broadcast pre-reset alert: %s", e)
-        # Then perform the reset
-        count = await self.db.reset_all_settings()
-        await interaction.response.send_message(
+        # The DB write and broadcast can exceed the 3 s interaction window.
+        await interaction.response.defer(ephemeral=True)
+        # Resolve logging channels before the reset clears them, then send the
+        # alert while the reset runs; individual send failures are swallowed.
+        channels = await self._log_channel_targets()
+        sent, count = await asyncio.gather(
+            self._broadcast_to_channels(
+                channels,
+                f"Global action by owner {interaction.user.mention}: All bot settings will be reset to defaults across all servers. You **_WILL_** need to re-set them.",
+            ),
+            self.db.reset_all_settings(),
+        )
+        if sent:
+            log.info("Broadcasted pre-reset alert to %d guild(s).", sent)
+        await interaction.followup.send(
             f"Reset settings to defaults across {count} server(s). Pre-reset alert sent to {sent} guild(s).",
             ephemeral=True,
         )
 
+    @_requires(guild=True)
     async def cmd_delete_my_data(self, interaction: discord.Interaction):
-        if not interaction.guild:
-            await interaction.response.send_message(
-                "This command can only be used in a server.", ephemeral=True
-            )
-            return
         try:
             c1, c2 = await self.db.delete_user_data_in_guild(
                 interaction.guild.id, interaction.user.id
@@ -1857,16 +1671,12 @@ class SanitizerBot(discord.Client):
                 ephemeral=True,
             )
 
+    @_requires(owner=True)
     async def cmd_delete_user_data(
         self, interaction: discord.Interaction, user: discord.User
     ):
         if not await owner_destructive_check(self, interaction):
             return
-        if not OWNER_ID or interaction.user.id != OWNER_ID:
-            await interaction.response.send_message(
-                "Only the bot owner can perform this action.", ephemeral=True
-            )
-            return
         try:
             n1, n2 = await self.db.delete_user_data_global(user.id)
             if (n1 or 0) + (n2 or 0) == 0:
@@ -1886,16 +1696,12 @@ class SanitizerBot(discord.Client):
                 f"Failed to delete data for {user.mention}{detail}", ephemeral=True
             )
 
+    @_requires(owner=True)
     async def cmd_global_delete_user_data(
         self,
         interaction: discord.Interaction,
         confirm: Optional[bool] = False,
     ):
-        if not OWNER_ID or interaction.user.id != OWNER_ID:
-            await interaction.response.send_message(
-                "Only the bot owner can perform this action.", ephemeral=True
-            )
-            return
         if not confirm:
             await interaction.response.send_message(
                 "Confirmation required: pass confirm=True to proceed.", ephemeral=True
@@ -1903,6 +1709,8 @@ class SanitizerBot(discord.Client):
             return
         if not await owner_destructive_check(self, interaction):
             return
+        # The DB write and broadcast can exceed the 3 s interaction window.
+        await interaction.response.defer(ephemeral=True)
         try:
             n1, n2 = await self.db.clear_all_user_data()
             try:
@@ -1912,28 +1720,24 @@ class SanitizerBot(discord.Client):
                 log.info("Announced user data deletion to %d guild(s).", sent)
             except Exception as be:
                 log.debug("Failed to broadcast deletion announcement: %s", be)
-            await interaction.response.send_message(
+            await interaction.followup.send(
                 f"Deleted ALL stored user data across all servers (cooldowns: {n1}, admin entries: {n2}). Announcement sent to logging channels where configured.",
                 ephemeral=True,
             )
         except Exception as e:
             msg = str(e).strip()
             detail = f": {msg}" if msg else "."
-            await interaction.response.send_message(
+            await interaction.followup.send(
                 f"Failed to delete all user data{detail}", ephemeral=True
             )
 
+    @_requires(owner=True)
     async def cmd_nuke_bot_admins(
         self,
         interaction: discord.Interaction,
         server_id: Optional[str] = None,
         confirm: Optional[bool] = False,
     ):
-        if not OWNER_ID or interaction.user.id != OWNER_ID:
-            await interaction.response.send_message(
-                "Only the bot owner can perform this action.", ephemeral=True
-            )
-            return
         if not confirm:
             await interaction.response.send_message(
                 "Confirmation required: pass confirm=True to proceed.", ephemeral=True
@@ -1965,20 +1769,10 @@ class SanitizerBot(discord.Client):
             f"Removed {deleted} bot admin(s) from {scope_note}.", ephemeral=True
         )
 
+    @_requires(config=True, owner=True)
     async def cmd_global_bot_disable(
         self, interaction: discord.Interaction, confirm: Optional[bool] = False
     ):
-        if self._config_error:
-            await interaction.response.send_message(
-                "The bot is currently disabled due to configuration issue(s). Please contact the bot owner.",
-                ephemeral=True,
-            )
-            return
-        if not OWNER_ID or interaction.user.id != OWNER_ID:
-            await interaction.response.send_message(
-                "Only the bot owner can perform this action.", ephemeral=True
-            )
-            return
         if not confirm:
             await interaction.response.send_message(
                 "Confirmation required: pass confirm=True to proceed.", ephemeral=True
@@ -1986,6 +1780,8 @@ class SanitizerBot(discord.Client):
             return
         if not await owner_destructive_check(self, interaction):
             return
+        # The DB write and broadcast can exceed the 3 s interaction window.
+        await interaction.response.defer(ephemeral=True)
         count = await self.db.disable_all()
 
         try:
@@ -1996,19 +1792,15 @@ class SanitizerBot(discord.Client):
                 log.info("Broadcasted global disable alert to %d guild(s).", sent)
         except Exception as e:
             log.debug("Failed to broadcast global disable alert: %s", e)
-        await interaction.response.send_message(
+        await interaction.followup.send(
             f"Globally disabled sanitizer across {count} server(s). Announcement sent to logging channels where configured.",
             ephemeral=True,
         )
 
+    @_requires(owner=True)
     async def cmd_global_nuke_bot_admins(
         self, interaction: discord.Interaction, confirm: Optional[bool] = False
     ):
-        if not OWNER_ID or interaction.user.id != OWNER_ID:
-            await interaction.response.send_message(
-                "Only the bot owner can perform this action.", ephemeral=True
-            )
-            return
         if not confirm:
             await interaction.response.send_message(
                 "Confirmation required: pass confirm=True to proceed.", ephemeral=True
@@ -2016,6 +1808,8 @@ class SanitizerBot(discord.Client):
             return
         if not await owner_destructive_check(self, interaction):
             return
+        # The DB write and broadcast can exceed the 3 s interaction window.
+        await interaction.response.defer(ephemeral=True)
         count = await self.db.clear_admins_global()
 
         try:
@@ -2026,7 +1820,7 @@ class SanitizerBot(discord.Client):
                 log.info("Broadcasted global nuke-admins alert to %d guild(s).", sent)
         except Exception as e:
             log.debug("Failed to broadcast global nuke-admins alert: %s", e)
-        await interaction.response.send_message(
+        await interaction.followup.send(
             f"Removed {count} bot admin(s) across all servers. Announcement sent to logging channels where configured.",
             ephemeral=True,
         )
@@ -2036,29 +1830,84 @@ class SanitizerBot(discord.Client):
 
         Returns the number of guilds where a message was sent.
         """
-        sent = 0
-        for guild in list(self.guilds):
-            # Fetch the logging channel configured for this guild
-            try:
-                settings = await self.db.get_settings(guild.id)
-                ch_id = settings.logging_channel_id
-            except Exception:
-                ch_id = None
-            if not ch_id:
+        channels = await self._log_channel_targets()
+        if not channels:
+            return 0
+        return await self._broadcast_to_channels(channels, content)
+
+    async def _log_channel_targets(
+        self,
+    ) -> list["discord.TextChannel | discord.Thread"]:
+        """Resolve the logging channel of every guild that has one configured."""
+        # Load every configured logging channel in one query
+        try:
+            channel_ids = await self.db.get_logging_channels()
+        except Exception as e:
+            log.debug("Failed to load logging channels for broadcast: %s", e)
+            return []
+        # Only guilds with a logging channel are visited. Channels are resolved
+        # from the gateway cache only; a channel missing from the cache is almost
+        # always deleted or hidden, so an HTTP fetch would not help.
+        channels = []
+        for gid, ch_id in channel_ids.items():
+            guild = self.get_guild(gid)
+            if guild is None:
                 continue
-            ch = guild.get_channel(ch_id)
-            if ch is None:
+            ch = await self._get_log_channel(guild, ch_id, fetch=False)
+            if ch is not None:
+                channels.append(ch)
+        return channels
+
+    async def _get_log_channel(
+        self, guild: discord.Guild, ch_id: int, fetch: bool = True
+    ) -> "discord.TextChannel | discord.Thread | None":
+        """Resolve a guild's logging channel, reusing the cached object when it still matches."""
+        ch = self._log_channel_cache.get(guild.id)
+        if ch is not None and ch.id == ch_id:
+            return ch
+        ch = guild.get_channel_or_thread(ch_id)
+        if ch is None and fetch:
+            # A deleted or hidden channel would otherwise cost a failing REST
+            # call on every sanitize; retry it only after a while.
+            miss = self._log_channel_misses.get(guild.id)
+            if (
+                miss is None
+                or miss[0] != ch_id
+                or now_mono() - miss[1] >= _LOG_CHANNEL_RETRY_SEC
+            ):
                 try:
                     ch = await guild.fetch_channel(ch_id)
                 except Exception:
                     ch = None
-            if isinstance(ch, (discord.TextChannel, discord.Thread)):
-                try:
-                    await ch.send(content)  # type: ignore
-                    sent += 1
-                except Exception:
-                    pass
-        return sent
+                if ch is None:
+                    self._log_channel_misses[guild.id] = (ch_id, now_mono())
+        if isinstance(ch, _SENDABLE_CHANNEL_TYPES):
+            self._log_channel_cache[guild.id] = ch
+            self._log_channel_misses.pop(guild.id, None)
+            return ch
+        self._log_channel_cache.pop(guild.id, None)
+        return None
+
+    async def _broadcast_to_channels(
+        self, channels: list["discord.TextChannel | discord.Thread"], content: str
+    ) -> int:
+        """Send a message to already-resolved channels; returns the number sent."""
+        # Rate limits are per channel, so sends to different guilds can overlap.
+        results = await asyncio.gather(
+            *(self._broadcast_send_one(ch, content) for ch in channels)
+        )
+        return sum(results)
+
+    async def _broadcast_send_one(
+        self, ch: "discord.TextChannel | discord.Thread", content: str
+    ) -> int:
+        """Send one broadcast message; returns 1 when sent, 0 otherwise."""
+        async with self._broadcast_semaphore:
+            try:
+                await ch.send(content)  # type: ignore
+                return 1
+            except Exception:
+                return 0
 
     async def _version_check_task(self) -> None:
         """Check for updates on startup and periodically at 00:00, 06:00, 12:00, 18:00 UTC."""
@@ -2244,6 +2093,7 @@ class SanitizerBot(discord.Client):
             ephemeral=True,
         )
 
+    @_requires(owner=True)
     async def cmd_blacklist_server(
         self,
         interaction: discord.Interaction,
@@ -2251,11 +2101,6 @@ class SanitizerBot(discord.Client):
         reason: Optional[str] = None,
         confirm: Optional[bool] = False,
     ):
-        if not OWNER_ID or interaction.user.id != OWNER_ID:
-            await interaction.response.send_message(
-                "Only the bot owner can perform this action.", ephemeral=True
-            )
-            return
         if not confirm:
             await interaction.response.send_message(
                 "Confirmation required: pass confirm=True to proceed.",
@@ -2298,17 +2143,13 @@ class SanitizerBot(discord.Client):
             ephemeral=True,
         )
 
+    @_requires(owner=True)
     async def cmd_unblacklist_server(
         self,
         interaction: discord.Interaction,
         server_id: str,
         confirm: Optional[bool] = False,
     ):
-        if not OWNER_ID or interaction.user.id != OWNER_ID:
-            await interaction.response.send_message(
-                "Only the bot owner can perform this action.", ephemeral=True
-            )
-            return
         if not confirm:
             await interaction.response.send_message(
                 "Confirmation required: pass confirm=True to proceed.",
@@ -2332,6 +2173,7 @@ class SanitizerBot(discord.Client):
             msg = f"Server ID {gid} was not in the blacklist."
         await interaction.response.send_message(msg, ephemeral=True)
 
+    @_requires(owner=True)
     async def cmd_set_blacklist_reason(
         self,
         interaction: discord.Interaction,
@@ -2339,11 +2181,6 @@ class SanitizerBot(discord.Client):
         reason: Optional[str] = None,
         confirm: Optional[bool] = False,
     ):
-        if not OWNER_ID or interaction.user.id != OWNER_ID:
-            await interaction.response.send_message(
-                "Only the bot owner can perform this action.", ephemeral=True
-            )
-            return
         if not confirm:
             await interaction.response.send_message(
                 "Confirmation required: pass confirm=True to proceed.",
@@ -2381,6 +2218,7 @@ class SanitizerBot(discord.Client):
         )
         await interaction.response.send_message(text, ephemeral=True)
 
+    @_requires(owner=True)
     async def cmd_set_blacklist_name(
         self,
         interaction: discord.Interaction,
@@ -2388,11 +2226,6 @@ class SanitizerBot(discord.Client):
         name: Optional[str] = None,
         confirm: Optional[bool] = False,
     ):
-        if not OWNER_ID or interaction.user.id != OWNER_ID:
-            await interaction.response.send_message(
-                "Only the bot owner can perform this action.", ephemeral=True
-            )
-            return
         if not confirm:
             await interaction.response.send_message(
                 "Confirmation required: pass confirm=True to proceed.",
@@ -2435,14 +2268,10 @@ class SanitizerBot(discord.Client):
     ):
         await dm_blacklisted_servers(self, interaction, attach_file)
 
+    @_requires(owner=True)
     async def cmd_list_bot_admins(
         self, interaction: discord.Interaction, server_id: Optional[str] = None
     ):
-        if not OWNER_ID or interaction.user.id != OWNER_ID:
-            await interaction.response.send_message(
-                "Only the bot owner can perform this action.", ephemeral=True
-            )
-            return
         gid = await resolve_target_guild(interaction, server_id)
         if gid is None:
             return
@@ -2499,7 +2328,7 @@ class SanitizerBot(discord.Client):
 
         # Apply 2 minute cooldown for bot-admins only (not for owner)
         if is_admin and not is_owner:
-            current_time = now()
+            current_time = now_mono()
             cooldown_seconds = 120
             time_remaining = cooldown_seconds - (
                 current_time - self._last_check_update_time
@@ -2588,17 +2417,13 @@ class SanitizerBot(discord.Client):
     ):
         await dm_all_reports(self, interaction, attach_file)
 
+    @_requires(owner=True)
     async def cmd_leave_server(
         self,
         interaction: discord.Interaction,
         server_id: str,
         confirm: Optional[bool] = False,
     ):
-        if not OWNER_ID or interaction.user.id != OWNER_ID:
-            await interaction.response.send_message(
-                "Only the bot owner can perform this action.", ephemeral=True
-            )
-            return
         if not confirm:
             await interaction.response.send_message(
                 "Confirmation required: pass confirm=True to proceed.",
@@ -2636,13 +2461,8 @@ class SanitizerBot(discord.Client):
         except Exception:
             ch_id = None
         if ch_id:
-            ch = guild.get_channel(ch_id)
-            if ch is None:
-                try:
-                    ch = await guild.fetch_channel(ch_id)
-                except Exception:
-                    ch = None
-            if ch is not None and isinstance(ch, (discord.TextChannel, discord.Thread)):
+            ch = await self._get_log_channel(guild, ch_id)
+            if ch is not None:
                 try:
                     await ch.send(
                         "Bot owner requested: Leaving this server and deleting stored data for this server."
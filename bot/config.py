@@ -6,8 +6,10 @@ Configuration and environment variable handling for NamelessNameSanitizerBot.
 This module loads and validates environment variables and defines the GuildSettings dataclass.
 """
 
+import base64
 import logging
 import os
+import re
 import sys
 from dataclasses import dataclass
 from typing import Optional
@@ -74,18 +76,27 @@ OWNER_DESTRUCTIVE_COOLDOWN_SECONDS = getenv_int(
     "OWNER_DESTRUCTIVE_COOLDOWN_SECONDS", 30
 )
 DEBUG_MODE = getenv_bool("DEBUG_MODE", False)
+FORCE_COMMAND_SYNC = getenv_bool("FORCE_COMMAND_SYNC", False)
 DISCORD_TOKEN = os.getenv("DISCORD_TOKEN")
 OWNER_ID = int(os.getenv("OWNER_ID", "0") or "0")
 DATABASE_URL = os.getenv("DATABASE_URL")
+DB_POOL_MIN_SIZE = max(1, getenv_int("DB_POOL_MIN_SIZE", 2))
+DB_POOL_MAX_SIZE = max(DB_POOL_MIN_SIZE, getenv_int("DB_POOL_MAX_SIZE", 10))
+DB_POOL_MAX_IDLE = max(1, getenv_int("DB_POOL_MAX_IDLE", 300))
+DB_POOL_TIMEOUT = max(1, getenv_int("DB_POOL_TIMEOUT", 30))
 _APP_ID = os.getenv("APPLICATION_ID", "").strip()
 APPLICATION_ID = int(_APP_ID) if _APP_ID.isdigit() else None
 SWEEP_INTERVAL_SEC = getenv_int("SWEEP_INTERVAL_SEC", 120)
 SWEEP_FETCH_MAX_RETRIES = max(0, getenv_int("SWEEP_FETCH_MAX_RETRIES", 3))
 SWEEP_RETRY_BASE_SEC = max(1, getenv_int("SWEEP_RETRY_BASE_SEC", 2))
 SWEEP_GUILD_DELAY_SEC = max(0, getenv_int("SWEEP_GUILD_DELAY_SEC", 1))
+SWEEP_GUILD_CONCURRENCY = max(1, getenv_int("SWEEP_GUILD_CONCURRENCY", 8))
+MESSAGE_RECHECK_SEC = max(0, getenv_int("MESSAGE_RECHECK_SEC", 30))
+SETTINGS_CACHE_TTL_SEC = max(0, getenv_int("SETTINGS_CACHE_TTL_SEC", 30))
+ADMIN_CACHE_TTL_SEC = max(0, getenv_int("ADMIN_CACHE_TTL_SEC", 60))
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class GuildSettings:
     guild_id: int
     check_length: int = CHECK_LENGTH
@@ -102,6 +113,9 @@ class GuildSettings:
     fallback_mode: str = FALLBACK_MODE
 
 
+_TOKEN_CHARS = re.compile(r"[A-Za-z0-9._-]+")
+
+
 def validate_discord_token(token: str):
     """Validate Discord token format and provide helpful error messages."""
     if not token:
@@ -114,7 +128,7 @@ def validate_discord_token(token: str):
             "DISCORD_TOKEN looks like a placeholder; please paste the real bot token from the Developer Portal."
         )
         sys.exit(1)
-    if any(ch.isspace() for ch in token):
+    if " " in token or not token.isprintable():
         log.error(
             "DISCORD_TOKEN contains whitespace; ensure there are no spaces or line breaks."
         )
@@ -126,16 +140,13 @@ def validate_discord_token(token: str):
         )
         sys.exit(1)
 
-    allowed = set("ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789._-")
-    if not set(token) <= allowed:
+    if not _TOKEN_CHARS.fullmatch(token):
         log.error(
             "DISCORD_TOKEN contains unexpected characters. Re-copy the token and avoid special characters."
         )
         sys.exit(1)
 
     try:
-        import base64
-
         seg0 = token.split(".")[0]
         seg0 += "=" * (-len(seg0) % 4)
         base64.urlsafe_b64decode(seg0.encode("ascii"))
@@ -7,16 +7,23 @@ This module handles all PostgreSQL database interactions including guild setting
 user cooldowns, bot admins, and blacklisted guilds.
 """
 
+import asyncio
+import functools
 import re
 import time
-from typing import Optional
+from typing import Iterable, Optional
 
 from psycopg import rows  # type: ignore
 from psycopg_pool import AsyncConnectionPool  # type: ignore
 
 from .config import (
+    ADMIN_CACHE_TTL_SEC,
     CHECK_LENGTH,
     COOLDOWN_SECONDS,
+    DB_POOL_MAX_IDLE,
+    DB_POOL_MAX_SIZE,
+    DB_POOL_MIN_SIZE,
+    DB_POOL_TIMEOUT,
     ENFORCE_BOTS,
     FALLBACK_LABEL,
     FALLBACK_MODE,
@@ -25,6 +32,7 @@ from .config import (
     OWNER_ID,
     PRESERVE_SPACES,
     SANITIZE_EMOJI,
+    SETTINGS_CACHE_TTL_SEC,
     GuildSettings,
 )
 
@@ -33,6 +41,11 @@ def now():
     return time.time()
 
 
+def _mark_retrieved(fut: asyncio.Future) -> None:
+    if not fut.cancelled():
+        fut.exception()
+
+
 def _normalize_bypass_role_value(value) -> str | None:
     def _extract_role_id(raw) -> str:
         try:
@@ -70,10 +83,134 @@ def _normalize_bypass_role_value(value) -> str | None:
     raise ValueError("Invalid bypass role value")
 
 
+# How long get_settings waits to collect concurrent cache misses into one query.
+_SETTINGS_BATCH_WINDOW_SEC = 0.005
+
+_PROTECTED_KEYS = frozenset({"OWNER_ID", "DISCORD_TOKEN", "APPLICATION_ID"})
+_SETTING_COLUMNS = frozenset(
+    {
+        "check_length",
+        "min_nick_length",
+        "max_nick_length",
+        "preserve_spaces",
+        "cooldown_seconds",
+        "sanitize_emoji",
+        "enabled",
+        "logging_channel_id",
+        "bypass_role_id",
+        "fallback_label",
+        "enforce_bots",
+        "fallback_mode",
+    }
+)
+# Integer settings and their (min, max) clamp; None means unbounded.
+_INT_SETTING_BOUNDS: dict[str, tuple[int, Optional[int]]] = {
+    "check_length": (0, None),
+    "cooldown_seconds": (0, None),
+    "min_nick_length": (0, 8),
+    "max_nick_length": (1, 32),
+}
+
+
+def _coerce_setting_value(key: str, value):
+    """Validate a settings key and return its value clamped/normalized for storage."""
+    if key.upper() in _PROTECTED_KEYS:
+        raise ValueError("Attempt to modify a protected variable")
+    if key not in _SETTING_COLUMNS:
+        raise ValueError(f"Unsupported setting: {key}")
+    if key in _INT_SETTING_BOUNDS:
+        lo, hi = _INT_SETTING_BOUNDS[key]
+        try:
+            iv = int(value)
+        except Exception:
+            raise ValueError(f"{key} must be an integer")
+        iv = max(lo, iv)
+        return iv if hi is None else min(hi, iv)
+    if key == "bypass_role_id":
+        return _normalize_bypass_role_value(value)
+    return value
+
+
+# Column list for class_row(GuildSettings); blank labels/modes fall back in SQL so
+# rows map straight onto the dataclass fields.
+_SETTINGS_SELECT = (
+    "SELECT guild_id, check_length, min_nick_length, max_nick_length, preserve_spaces, "
+    "cooldown_seconds, sanitize_emoji, enabled, logging_channel_id, bypass_role_id, "
+    "CASE WHEN btrim(COALESCE(fallback_label, ''), E' \\t\\n\\r\\f\\x0b') = '' "
+    "THEN %s ELSE fallback_label END AS fallback_label, "
+    "enforce_bots, COALESCE(NULLIF(fallback_mode, ''), %s) AS fallback_mode "
+    "FROM guild_settings"
+)
+
+
+class _TTLCache:
+    """Small in-memory TTL cache; invalidation also discards loads already in flight."""
+
+    __slots__ = ("ttl", "generation", "_entries")
+
+    def __init__(self, ttl: int):
+        self.ttl = ttl
+        self.generation = 0
+        self._entries: dict[int, tuple[float, object]] = {}
+
+    def get(self, key: int):
+        entry = self._entries.get(key)
+        if entry is None or time.monotonic() - entry[0] >= self.ttl:
+            return None
+        return entry[1]
+
+    def put(self, key: int, value, generation: int):
+        # Skip the store if an invalidation happened while the value was loading.
+        if self.ttl > 0 and generation == self.generation:
+            self._entries[key] = (time.monotonic(), value)
+
+    def invalidate(self, key: Optional[int] = None):
+        self.generation += 1
+        if key is None:
+            self._entries.clear()
+        else:
+            self._entries.pop(key, None)
+
+
+def _invalidates(*cache_attrs: str, per_guild: bool = True):
+    """Drop the named caches once the decorated write finishes (or fails).
+
+    With per_guild=True only the entry for the method's guild_id argument is dropped.
+    """
+
+    def decorator(method):
+        @functools.wraps(method)
+        async def wrapper(self, *args, **kwargs):
+            try:
+                return await method(self, *args, **kwargs)
+            finally:
+                key = None
+                if per_guild:
+                    key = kwargs.get("guild_id", args[0] if args else None)
+                for attr in cache_attrs:
+                    getattr(self, attr).invalidate(key)
+
+        return wrapper
+
+    return decorator
+
+
 class Database:
     def __init__(self, dsn: str):
         self.dsn = dsn
         self.pool: Optional[AsyncConnectionPool] = None
+        # Per-guild caches; every write that touches the underlying rows invalidates them.
+        self._settings_cache = _TTLCache(SETTINGS_CACHE_TTL_SEC)
+        self._admin_cache = _TTLCache(ADMIN_CACHE_TTL_SEC)
+        # user_id -> cooldown timestamp written by this process; lets repeat checks
+        # skip the query. Pruned with the table by clear_expired_cooldowns().
+        self._known_cooldowns: dict[int, float] = {}
+        # Set once init() has ensured the schema.
+        self._initialized = False
+        # get_settings cache misses waiting for the next batched query.
+        self._settings_pending: dict[int, asyncio.Future] = {}
+        # Flushes still running; a new batch can start while an older one loads.
+        self._settings_flush_tasks: set[asyncio.Task] = set()
 
     async def connect(self):
         if not self.dsn:
@@ -81,115 +218,178 @@ class Database:
         # Reuse an existing open pool across reconnects.
         if self.pool is None:
             self.pool = AsyncConnectionPool(
-                self.dsn, min_size=1, max_size=5, open=False
+                self.dsn,
+                min_size=DB_POOL_MIN_SIZE,
+                max_size=DB_POOL_MAX_SIZE,
+                max_idle=DB_POOL_MAX_IDLE,
+                timeout=DB_POOL_TIMEOUT,
+                open=False,
             )
         if not getattr(self.pool, "closed", True):
             return
         await self.pool.open()  # type: ignore
 
     async def close(self):
+        tasks = list(self._settings_flush_tasks)
+        for task in tasks:
+            task.cancel()
+        if tasks:
+            await asyncio.gather(*tasks, return_exceptions=True)
+        self._settings_flush_tasks.clear()
+        # A flush cancelled before it first ran never saw its waiters.
+        pending, self._settings_pending = self._settings_pending, {}
+        for fut in pending.values():
+            if not fut.done():
+                fut.set_exception(RuntimeError("Database is closing."))
         if self.pool is None:
             return
         try:
             await self.pool.close()  # type: ignore
         finally:
             self.pool = None
+            self._settings_cache.invalidate()
+            self._admin_cache.invalidate()
+
+    def cached_settings(self, guild_id: int) -> Optional[GuildSettings]:
+        """Return cached settings for a guild without awaiting, or None on a miss."""
+        return self._settings_cache.get(guild_id)
 
     async def init(self):
         assert self.pool is not None
+        # on_ready fires again after every gateway reconnect; the schema only needs
+        # to be ensured once per process.
+        if self._initialized:
+            return
         async with self.pool.connection() as conn:
-            async with conn.cursor() as cur:
-                await cur.execute(f"""
-                CREATE TABLE IF NOT EXISTS guild_settings (
-                    guild_id BIGINT PRIMARY KEY,
-                    check_length INTEGER NOT NULL DEFAULT {CHECK_LENGTH},
-                    min_nick_length INTEGER NOT NULL DEFAULT {MIN_NICK_LENGTH},
-                    max_nick_length INTEGER NOT NULL DEFAULT {MAX_NICK_LENGTH},
-                    preserve_spaces BOOLEAN NOT NULL DEFAULT {'TRUE' if PRESERVE_SPACES else 'FALSE'},
-                    cooldown_seconds INTEGER NOT NULL DEFAULT {COOLDOWN_SECONDS},
-                    sanitize_emoji BOOLEAN NOT NULL DEFAULT {'TRUE' if SANITIZE_EMOJI else 'FALSE'},
-                    enabled BOOLEAN NOT NULL DEFAULT FALSE,
-                    logging_channel_id BIGINT,
-                    bypass_role_id TEXT,
-                    fallback_label TEXT,
-                    enforce_bots BOOLEAN NOT NULL DEFAULT {'TRUE' if ENFORCE_BOTS else 'FALSE'},
-                    fallback_mode TEXT NOT NULL DEFAULT '{FALLBACK_MODE}'
-                );
-                """)
-            async with conn.cursor() as cur:
-                await cur.execute("""
-                CREATE TABLE IF NOT EXISTS user_cooldowns (
-                    user_id BIGINT PRIMARY KEY,
-                    timestamp DOUBLE PRECISION NOT NULL
-                );
-                """)
-            async with conn.cursor() as cur:
-                await cur.execute("""
-                CREATE TABLE IF NOT EXISTS guild_admins (
-                    guild_id BIGINT NOT NULL,
-                    user_id BIGINT NOT NULL,
-                    PRIMARY KEY (guild_id, user_id)
-                );
-                """)
-            async with conn.cursor() as cur:
-                await cur.execute(
-                    f"ALTER TABLE guild_settings ADD COLUMN IF NOT EXISTS sanitize_emoji BOOLEAN NOT NULL DEFAULT {'TRUE' if SANITIZE_EMOJI else 'FALSE'}"
-                )
-            async with conn.cursor() as cur:
-                await cur.execute(
-                    f"ALTER TABLE guild_settings ADD COLUMN IF NOT EXISTS enforce_bots BOOLEAN NOT NULL DEFAULT {'TRUE' if ENFORCE_BOTS else 'FALSE'}"
-                )
-            # Blacklist table for guilds the bot should automatically leave/avoid
-            async with conn.cursor() as cur:
-                await cur.execute("""
-                CREATE TABLE IF NOT EXISTS blacklist_guilds (
-                    guild_id BIGINT PRIMARY KEY,
-                    name TEXT,
-                    reason TEXT
-                );
-                """)
-            # Ensure 'name' column exists for older installs
-            async with conn.cursor() as cur:
-                await cur.execute(
-                    "ALTER TABLE blacklist_guilds ADD COLUMN IF NOT EXISTS name TEXT"
-                )
-            async with conn.cursor(row_factory=rows.tuple_row) as cur:
-                await cur.execute("""
-                    SELECT column_name FROM information_schema.columns
-                    WHERE table_name = 'guild_settings'
+            async with conn.transaction():
+                # Parameterless statements can be sent as one batch.
+                async with conn.cursor() as cur:
+                    await cur.execute(f"""
+                    CREATE TABLE IF NOT EXISTS guild_settings (
+                        guild_id BIGINT PRIMARY KEY,
+                        check_length INTEGER NOT NULL DEFAULT {CHECK_LENGTH},
+                        min_nick_length INTEGER NOT NULL DEFAULT {MIN_NICK_LENGTH},
+                        max_nick_length INTEGER NOT NULL DEFAULT {MAX_NICK_LENGTH},
+                        preserve_spaces BOOLEAN NOT NULL DEFAULT {'TRUE' if PRESERVE_SPACES else 'FALSE'},
+                        cooldown_seconds INTEGER NOT NULL DEFAULT {COOLDOWN_SECONDS},
+                        sanitize_emoji BOOLEAN NOT NULL DEFAULT {'TRUE' if SANITIZE_EMOJI else 'FALSE'},
+                        enabled BOOLEAN NOT NULL DEFAULT FALSE,
+                        logging_channel_id BIGINT,
+                        bypass_role_id TEXT,
+                        fallback_label TEXT,
+                        enforce_bots BOOLEAN NOT NULL DEFAULT {'TRUE' if ENFORCE_BOTS else 'FALSE'},
+                        fallback_mode TEXT NOT NULL DEFAULT '{FALLBACK_MODE}'
+                    );
+                    -- Cooldowns are short-lived and purged on a timer, so the table skips
+                    -- the WAL. A crash empties it, which only lets users be re-checked early.
+                    CREATE UNLOGGED TABLE IF NOT EXISTS user_cooldowns (
+                        user_id BIGINT PRIMARY KEY,
+                        timestamp DOUBLE PRECISION NOT NULL
+                    );
+                    CREATE TABLE IF NOT EXISTS guild_admins (
+                        guild_id BIGINT NOT NULL,
+                        user_id BIGINT NOT NULL,
+                        PRIMARY KEY (guild_id, user_id)
+                    );
+                    -- Small key/value store for bot-level state (e.g. the synced command hash)
+                    CREATE TABLE IF NOT EXISTS bot_meta (
+                        key TEXT PRIMARY KEY,
+                        value TEXT
+                    );
+                    -- Blacklist table for guilds the bot should automatically leave/avoid
+                    CREATE TABLE IF NOT EXISTS blacklist_guilds (
+                        guild_id BIGINT PRIMARY KEY,
+                        name TEXT,
+                        reason TEXT
+                    );
                     """)
-                cols = await cur.fetchall()
-            colset = {r[0] for r in cols}
-            renames = {
-                "check_n": "check_length",
-                "min_len": "min_nick_length",
-                "max_len": "max_nick_length",
-                "cooldown_sec": "cooldown_seconds",
-            }
-            for old, new in renames.items():
-                if old in colset and new not in colset:
+                async with conn.cursor(row_factory=rows.tuple_row) as cur:
+                    await cur.execute("""
+                        SELECT table_name, column_name FROM information_schema.columns
+                        WHERE table_name IN ('guild_settings', 'blacklist_guilds')
+                        """)
+                    cols = await cur.fetchall()
+                    await cur.execute(
+                        "SELECT relpersistence FROM pg_class WHERE oid = 'user_cooldowns'::regclass"
+                    )
+                    persistence = await cur.fetchone()
+                if persistence and persistence[0] == "p":
+                    # Installs created before the table was UNLOGGED.
                     try:
-                        async with conn.cursor() as cur2:
-                            await cur2.execute(
-                                f"ALTER TABLE guild_settings RENAME COLUMN {old} TO {new}"
-                            )
-                        colset.remove(old)
-                        colset.add(new)
+                        async with conn.transaction():
+                            async with conn.cursor() as cur2:
+                                await cur2.execute(
+                                    "ALTER TABLE user_cooldowns SET UNLOGGED"
+                                )
                     except Exception:
                         pass
-            for stmt in (
-                "ALTER TABLE guild_settings ADD COLUMN IF NOT EXISTS enabled BOOLEAN NOT NULL DEFAULT FALSE",
-                "ALTER TABLE guild_settings ADD COLUMN IF NOT EXISTS logging_channel_id BIGINT",
-                "ALTER TABLE guild_settings ADD COLUMN IF NOT EXISTS bypass_role_id TEXT",
-                "ALTER TABLE guild_settings ADD COLUMN IF NOT EXISTS fallback_label TEXT",
-                f"ALTER TABLE guild_settings ADD COLUMN IF NOT EXISTS enforce_bots BOOLEAN NOT NULL DEFAULT {'TRUE' if ENFORCE_BOTS else 'FALSE'}",
-                f"ALTER TABLE guild_settings ADD COLUMN IF NOT EXISTS fallback_mode TEXT NOT NULL DEFAULT '{FALLBACK_MODE}'",
-            ):
-                async with conn.cursor() as cur:
-                    await cur.execute(stmt)
+                colset = {r[1] for r in cols if r[0] == "guild_settings"}
+                renames = {
+                    "check_n": "check_length",
+                    "min_len": "min_nick_length",
+                    "max_len": "max_nick_length",
+                    "cooldown_sec": "cooldown_seconds",
+                }
+                for old, new in renames.items():
+                    if old in colset and new not in colset:
+                        try:
+                            # Savepoint so a failed rename does not abort the transaction.
+                            async with conn.transaction():
+                                async with conn.cursor() as cur2:
+                                    await cur2.execute(
+                                        f"ALTER TABLE guild_settings RENAME COLUMN {old} TO {new}"
+                                    )
+                            colset.remove(old)
+                            colset.add(new)
+                        except Exception:
+                            pass
+                # Columns added after the first release; only missing ones are altered.
+                added_columns = {
+                    "sanitize_emoji": f"BOOLEAN NOT NULL DEFAULT {'TRUE' if SANITIZE_EMOJI else 'FALSE'}",
+                    "enforce_bots": f"BOOLEAN NOT NULL DEFAULT {'TRUE' if ENFORCE_BOTS else 'FALSE'}",
+                    "enabled": "BOOLEAN NOT NULL DEFAULT FALSE",
+                    "logging_channel_id": "BIGINT",
+                    "bypass_role_id": "TEXT",
+                    "fallback_label": "TEXT",
+                    "fallback_mode": f"TEXT NOT NULL DEFAULT '{FALLBACK_MODE}'",
+                }
+                ddl = [
+                    f"ALTER TABLE guild_settings ADD COLUMN IF NOT EXISTS {col} {decl};"
+                    for col, decl in added_columns.items()
+                    if col not in colset
+                ]
+                # 'name' column for blacklist tables from older installs
+                if ("blacklist_guilds", "name") not in cols:
+                    ddl.append(
+                        "ALTER TABLE blacklist_guilds ADD COLUMN IF NOT EXISTS name TEXT;"
+                    )
+                if ddl:
+                    async with conn.cursor() as cur:
+                        await cur.execute("\n".join(ddl))
+        self._initialized = True
+
+    async def get_meta(self, key: str) -> Optional[str]:
+        assert self.pool is not None
+        async with self.pool.connection() as conn:
+            async with conn.cursor(row_factory=rows.tuple_row) as cur:
+                await cur.execute("SELECT value FROM bot_meta WHERE key=%s", (key,))
+                row = await cur.fetchone()
+                return row[0] if row else None
+
+    async def set_meta(self, key: str, value: Optional[str]):
+        assert self.pool is not None
+        async with self.pool.connection() as conn:
+            async with conn.cursor() as cur:
+                await cur.execute(
+                    "INSERT INTO bot_meta (key, value) VALUES (%s, %s) ON CONFLICT (key) DO UPDATE SET value = EXCLUDED.value",
+                    (key, value),
+                )
 
     async def get_cooldown(self, user_id: int) -> Optional[float]:
         assert self.pool is not None
+        known = self._known_cooldowns.get(user_id)
+        if known is not None:
+            return known
         async with self.pool.connection() as conn:
             async with conn.cursor(row_factory=rows.dict_row) as cur:
                 await cur.execute(
@@ -199,8 +399,36 @@ class Database:
                 row = await cur.fetchone()
                 return float(row["timestamp"]) if row else None
 
+    async def get_cooldowns(self, user_ids: Iterable[int]) -> dict[int, float]:
+        """Return {user_id: timestamp} for the given users in one query.
+
+        Users without a stored cooldown are omitted.
+        """
+        assert self.pool is not None
+        found: dict[int, float] = {}
+        ids = []
+        for uid in user_ids:
+            known = self._known_cooldowns.get(uid)
+            if known is None:
+                ids.append(uid)
+            else:
+                found[uid] = known
+        if not ids:
+            return found
+        async with self.pool.connection() as conn:
+            async with conn.cursor(row_factory=rows.tuple_row) as cur:
+                await cur.execute(
+                    "SELECT user_id, timestamp FROM user_cooldowns WHERE user_id = ANY(%s::BIGINT[])",
+                    (ids,),
+                )
+                rows_ = await cur.fetchall()
+                found.update((int(r[0]), float(r[1])) for r in rows_)
+                return found
+
     async def set_cooldown(self, user_id: int, timestamp: float):
         assert self.pool is not None
+        # Recorded before the write so events racing the upsert already see it.
+        self._known_cooldowns[user_id] = timestamp
         async with self.pool.connection() as conn:
             async with conn.cursor() as cur:
                 await cur.execute(
@@ -208,9 +436,26 @@ class Database:
                     (user_id, timestamp),
                 )
 
+    async def set_cooldowns(self, user_ids: Iterable[int], timestamp: float):
+        """Upsert the same cooldown timestamp for several users in one statement."""
+        assert self.pool is not None
+        ids = list(user_ids)
+        if not ids:
+            return
+        self._known_cooldowns.update(dict.fromkeys(ids, timestamp))
+        async with self.pool.connection() as conn:
+            async with conn.cursor() as cur:
+                await cur.execute(
+                    "INSERT INTO user_cooldowns (user_id, timestamp) SELECT DISTINCT unnest(%s::BIGINT[]), %s ON CONFLICT (user_id) DO UPDATE SET timestamp = EXCLUDED.timestamp",
+                    (ids, timestamp),
+                )
+
     async def clear_expired_cooldowns(self, ttl: int):
         assert self.pool is not None
         cutoff = now() - ttl
+        self._known_cooldowns = {
+            uid: ts for uid, ts in self._known_cooldowns.items() if ts >= cutoff
+        }
         async with self.pool.connection() as conn:
             async with conn.cursor() as cur:
                 await cur.execute(
@@ -218,12 +463,14 @@ class Database:
                     (cutoff,),
                 )
 
+    @_invalidates("_admin_cache", per_guild=False)
     async def delete_user_data_global(self, user_id: int) -> tuple[int, int]:
         """Delete stored data for a user across all guilds.
 
         Returns (cooldowns_deleted, admin_rows_deleted).
         """
         assert self.pool is not None
+        self._known_cooldowns.pop(user_id, None)
         async with self.pool.connection() as conn:
             async with conn.cursor() as cur:
                 await cur.execute(
@@ -237,6 +484,7 @@ class Database:
                 n2 = cur.rowcount or 0
             return int(n1), int(n2)
 
+    @_invalidates("_admin_cache")
     async def delete_user_data_in_guild(
         self, guild_id: int, user_id: int
     ) -> tuple[int, int]:
@@ -246,6 +494,7 @@ class Database:
         Returns (cooldowns_deleted, admin_rows_deleted_in_guild).
         """
         assert self.pool is not None
+        self._known_cooldowns.pop(user_id, None)
         async with self.pool.connection() as conn:
             async with conn.cursor() as cur:
                 await cur.execute(
@@ -260,12 +509,14 @@ class Database:
                 n2 = cur.rowcount or 0
             return int(n1), int(n2)
 
+    @_invalidates("_admin_cache", per_guild=False)
     async def clear_all_user_data(self) -> tuple[int, int]:
         """Delete all user-related data across all servers.
 
         Returns (cooldowns_deleted, admin_rows_deleted).
         """
         assert self.pool is not None
+        self._known_cooldowns.clear()
         async with self.pool.connection() as conn:
             async with conn.cursor() as cur:
                 await cur.execute("DELETE FROM user_cooldowns")
@@ -276,115 +527,84 @@ class Database:
             return int(n1), int(n2)
 
     async def get_settings(self, guild_id: int) -> GuildSettings:
+        cached = self._settings_cache.get(guild_id)
+        if cached is not None:
+            return cached
+        # Cache misses landing within one batch window share a single query.
+        fut = self._settings_pending.get(guild_id)
+        if fut is None:
+            if not self._settings_pending:
+                task = asyncio.create_task(self._flush_settings_batch())
+                self._settings_flush_tasks.add(task)
+                task.add_done_callback(self._settings_flush_tasks.discard)
+            fut = asyncio.get_running_loop().create_future()
+            # Every waiter may have been cancelled; don't log the error as unretrieved.
+            fut.add_done_callback(_mark_retrieved)
+            self._settings_pending[guild_id] = fut
+        # Shield so one cancelled caller does not cancel the shared result.
+        return await asyncio.shield(fut)
+
+    async def _flush_settings_batch(self):
+        pending: Optional[dict[int, asyncio.Future]] = None
+        try:
+            await asyncio.sleep(_SETTINGS_BATCH_WINDOW_SEC)
+            pending, self._settings_pending = self._settings_pending, {}
+            generation = self._settings_cache.generation
+            loaded = await self._load_settings_many(pending)
+        except BaseException as e:
+            # Fail every waiter, including on cancellation, so no caller is left
+            # awaiting a future nobody will resolve.
+            if pending is None:
+                pending, self._settings_pending = self._settings_pending, {}
+            err = (
+                e
+                if isinstance(e, Exception)
+                else RuntimeError("Settings load was cancelled.")
+            )
+            for fut in pending.values():
+                if not fut.done():
+                    fut.set_exception(err)
+            if isinstance(e, Exception):
+                return
+            raise
+        for guild_id, fut in pending.items():
+            settings = loaded[guild_id]
+            self._settings_cache.put(guild_id, settings, generation)
+            if not fut.done():
+                fut.set_result(settings)
+
+    async def _load_settings_many(
+        self, guild_ids: Iterable[int]
+    ) -> dict[int, GuildSettings]:
+        """Load settings for several guilds in one query; missing rows get defaults."""
         assert self.pool is not None
+        ids = list(guild_ids)
         async with self.pool.connection() as conn:
-            async with conn.cursor(row_factory=rows.dict_row) as cur:
+            async with conn.cursor(row_factory=rows.class_row(GuildSettings)) as cur:
                 await cur.execute(
-                    "SELECT guild_id, check_length, min_nick_length, max_nick_length, preserve_spaces, cooldown_seconds, sanitize_emoji, enabled, logging_channel_id, bypass_role_id, fallback_label, enforce_bots, fallback_mode FROM guild_settings WHERE guild_id=%s",
-                    (guild_id,),
+                    _SETTINGS_SELECT + " WHERE guild_id = ANY(%s::BIGINT[])",
+                    (FALLBACK_LABEL, FALLBACK_MODE, ids),
                 )
-                row = await cur.fetchone()
-                if row:
-                    fallback_label = row.get("fallback_label")
-                    if not str(fallback_label or "").strip():
-                        fallback_label = FALLBACK_LABEL
-                    fallback_mode = row.get("fallback_mode") or FALLBACK_MODE
-                    return GuildSettings(
-                        guild_id=row["guild_id"],
-                        check_length=row["check_length"],
-                        min_nick_length=row["min_nick_length"],
-                        max_nick_length=row["max_nick_length"],
-                        preserve_spaces=row["preserve_spaces"],
-                        cooldown_seconds=row["cooldown_seconds"],
-                        sanitize_emoji=row["sanitize_emoji"],
-                        enabled=row["enabled"],
-                        logging_channel_id=row.get("logging_channel_id"),
-                        bypass_role_id=row.get("bypass_role_id"),
-                        fallback_label=fallback_label,
-                        enforce_bots=row.get("enforce_bots", False),
-                        fallback_mode=fallback_mode,
-                    )
-                return GuildSettings(guild_id=guild_id)
+                found = {row.guild_id: row for row in await cur.fetchall()}
+        return {gid: found.get(gid) or GuildSettings(guild_id=gid) for gid in ids}
 
-    async def set_min_max_lengths(self, guild_id: int, min_len: int, max_len: int):
+    async def get_logging_channels(self) -> dict[int, int]:
+        """Return {guild_id: logging_channel_id} for every guild with a logging channel."""
         assert self.pool is not None
-        try:
-            min_v = min(8, max(0, int(min_len)))
-        except Exception:
-            raise ValueError("min_nick_length must be an integer")
-        try:
-            max_v = min(32, max(1, int(max_len)))
-        except Exception:
-            raise ValueError("max_nick_length must be an integer")
-        if min_v > max_v:
-            raise ValueError(
-                f"min_nick_length ({min_v}) cannot be greater than max_nick_length ({max_v})"
-            )
         async with self.pool.connection() as conn:
-            async with conn.cursor() as cur:
-                await cur.execute(
-                    "INSERT INTO guild_settings (guild_id) VALUES (%s) ON CONFLICT (guild_id) DO NOTHING",
-                    (guild_id,),
-                )
-            async with conn.cursor() as cur:
+            async with conn.cursor(row_factory=rows.tuple_row) as cur:
                 await cur.execute(
-                    "UPDATE guild_settings SET min_nick_length = %s, max_nick_length = %s WHERE guild_id=%s",
-                    (min_v, max_v, guild_id),
+                    "SELECT guild_id, logging_channel_id FROM guild_settings WHERE logging_channel_id IS NOT NULL"
                 )
+                rows_ = await cur.fetchall()
+                return {int(r[0]): int(r[1]) for r in rows_}
 
-    async def set_setting(self, guild_id: int, key: str, value):
+    @_invalidates("_settings_cache")
+    async def set_setting(self, guild_id: int, key: str, value) -> bool:
+        """Write a single setting and return the guild's resulting enabled flag."""
         assert self.pool is not None
-
-        if key.upper() in {
-            "OWNER_ID",
-            "DISCORD_TOKEN",
-            "APPLICATION_ID",
-        }:
-            raise ValueError("Attempt to modify a protected variable")
-
-        columns = {
-            "check_length": "check_length",
-            "min_nick_length": "min_nick_length",
-            "max_nick_length": "max_nick_length",
-            "preserve_spaces": "preserve_spaces",
-            "cooldown_seconds": "cooldown_seconds",
-            "sanitize_emoji": "sanitize_emoji",
-            "enabled": "enabled",
-            "logging_channel_id": "logging_channel_id",
-            "bypass_role_id": "bypass_role_id",
-            "fallback_label": "fallback_label",
-            "enforce_bots": "enforce_bots",
-            "fallback_mode": "fallback_mode",
-        }
-        col = columns.get(key)
-        if not col:
-            raise ValueError(f"Unsupported setting: {key}")
-        if col == "check_length":
-            try:
-                iv = int(value)
-            except Exception:
-                raise ValueError("check_length must be an integer")
-            value = max(0, iv)
-        if col == "cooldown_seconds":
-            try:
-                iv = int(value)
-            except Exception:
-                raise ValueError("cooldown_seconds must be an integer")
-            value = max(0, iv)
-        if col == "min_nick_length":
-            try:
-                iv = int(value)
-            except Exception:
-                raise ValueError("min_nick_length must be an integer")
-            # Clamp to [0, 8]
-            value = min(8, max(0, iv))
-        if col == "max_nick_length":
-            try:
-                iv = int(value)
-            except Exception:
-                raise ValueError("max_nick_length must be an integer")
-            # Clamp to [1, 32]
-            value = min(32, max(1, iv))
+        col = key
+        value = _coerce_setting_value(key, value)
         async with self.pool.connection() as conn:
             async with conn.cursor() as cur:
                 await cur.execute(
@@ -409,21 +629,13 @@ class Database:
                         raise ValueError(
                             f"max_nick_length ({value}) cannot be less than min_nick_length ({existing_min})"
                         )
-            if col == "bypass_role_id":
-                normalized = _normalize_bypass_role_value(value)
-                async with conn.cursor() as cur:
-                    await cur.execute(
-                        "UPDATE guild_settings SET bypass_role_id = %s WHERE guild_id=%s",
-                        (normalized, guild_id),
-                    )
-                return
-
             try:
-                async with conn.cursor() as cur:
+                async with conn.cursor(row_factory=rows.tuple_row) as cur:
                     await cur.execute(
-                        f"UPDATE guild_settings SET {col} = %s WHERE guild_id=%s",
+                        f"UPDATE guild_settings SET {col} = %s WHERE guild_id=%s RETURNING enabled",
                         (value, guild_id),
                     )
+                    row = await cur.fetchone()
             except Exception as e:
                 if col == "fallback_label" and isinstance(e, Exception):
                     try:
@@ -431,16 +643,68 @@ class Database:
                             await cur.execute(
                                 "ALTER TABLE guild_settings ADD COLUMN IF NOT EXISTS fallback_label TEXT"
                             )
-                        async with conn.cursor() as cur:
+                        async with conn.cursor(row_factory=rows.tuple_row) as cur:
                             await cur.execute(
-                                f"UPDATE guild_settings SET {col} = %s WHERE guild_id=%s",
+                                f"UPDATE guild_settings SET {col} = %s WHERE guild_id=%s RETURNING enabled",
                                 (value, guild_id),
                             )
-                        return
+                            row = await cur.fetchone()
+                        return bool(row and row[0])
                     except Exception:
                         pass
                 raise
+            return bool(row and row[0])
 
+    @_invalidates("_settings_cache")
+    async def set_settings_bulk(self, guild_id: int, updates: dict[str, object]):
+        """Apply several settings for a guild in a single transaction.
+
+        Values are validated and clamped like set_setting; nothing is written if any
+        value is invalid or the resulting min/max nick lengths would conflict.
+        """
+        assert self.pool is not None
+        if not updates:
+            return
+        values = {key: _coerce_setting_value(key, v) for key, v in updates.items()}
+        if "min_nick_length" not in values and "max_nick_length" not in values:
+            # Nothing to cross-check, so the row is created and updated in one upsert.
+            cols = ", ".join(values)
+            placeholders = ", ".join(["%s"] * len(values))
+            assignments = ", ".join(f"{col} = EXCLUDED.{col}" for col in values)
+            async with self.pool.connection() as conn:
+                async with conn.cursor() as cur:
+                    await cur.execute(
+                        f"INSERT INTO guild_settings (guild_id, {cols}) VALUES (%s, {placeholders}) "
+                        f"ON CONFLICT (guild_id) DO UPDATE SET {assignments}",
+                        (guild_id, *values.values()),
+                    )
+            return
+        async with self.pool.connection() as conn:
+            async with conn.transaction():
+                # Create-or-lock the row and read the current bounds in one statement.
+                async with conn.cursor(row_factory=rows.tuple_row) as cur:
+                    await cur.execute(
+                        "INSERT INTO guild_settings (guild_id) VALUES (%s) "
+                        "ON CONFLICT (guild_id) DO UPDATE SET guild_id = EXCLUDED.guild_id "
+                        "RETURNING min_nick_length, max_nick_length",
+                        (guild_id,),
+                    )
+                    row = await cur.fetchone()
+                if row:
+                    new_min = int(values.get("min_nick_length", row[0]))  # type: ignore[arg-type]
+                    new_max = int(values.get("max_nick_length", row[1]))  # type: ignore[arg-type]
+                    if new_min > new_max:
+                        raise ValueError(
+                            f"min_nick_length ({new_min}) cannot be greater than max_nick_length ({new_max})"
+                        )
+                assignments = ", ".join(f"{col} = %s" for col in values)
+                async with conn.cursor() as cur:
+                    await cur.execute(
+                        f"UPDATE guild_settings SET {assignments} WHERE guild_id=%s",
+                        (*values.values(), guild_id),
+                    )
+
+    @_invalidates("_admin_cache")
     async def add_admin(self, guild_id: int, user_id: int):
         assert self.pool is not None
         async with self.pool.connection() as conn:
@@ -450,6 +714,7 @@ class Database:
                     (guild_id, user_id),
                 )
 
+    @_invalidates("_admin_cache")
     async def remove_admin(self, guild_id: int, user_id: int):
         assert self.pool is not None
         async with self.pool.connection() as conn:
@@ -471,6 +736,26 @@ class Database:
                 rows_ = await cur.fetchall()
                 return [int(r[0]) for r in rows_]
 
+    async def list_admins_many(self, guild_ids: Iterable[int]) -> dict[int, list[int]]:
+        """Return {guild_id: [user_id, ...]} for several guilds in one query.
+
+        Every requested guild is present; guilds without admins map to an empty list.
+        """
+        assert self.pool is not None
+        admins: dict[int, list[int]] = {int(gid): [] for gid in guild_ids}
+        if not admins:
+            return admins
+        async with self.pool.connection() as conn:
+            async with conn.cursor(row_factory=rows.tuple_row) as cur:
+                await cur.execute(
+                    "SELECT guild_id, user_id FROM guild_admins WHERE guild_id = ANY(%s::BIGINT[]) "
+                    "ORDER BY guild_id, user_id ASC",
+                    (list(admins),),
+                )
+                for gid, uid in await cur.fetchall():
+                    admins[int(gid)].append(int(uid))
+        return admins
+
     async def add_blacklisted_guild(
         self, guild_id: int, reason: Optional[str] = None, name: Optional[str] = None
     ):
@@ -495,16 +780,6 @@ class Database:
                 )
                 return int(cur.rowcount or 0)
 
-    async def is_guild_blacklisted(self, guild_id: int) -> bool:
-        assert self.pool is not None
-        async with self.pool.connection() as conn:
-            async with conn.cursor() as cur:
-                await cur.execute(
-                    "SELECT 1 FROM blacklist_guilds WHERE guild_id=%s",
-                    (guild_id,),
-                )
-                return (await cur.fetchone()) is not None
-
     async def list_blacklisted_guilds(
         self,
     ) -> list[tuple[int, Optional[str], Optional[str]]]:
@@ -557,19 +832,22 @@ class Database:
                 )
                 return int(cur.rowcount or 0)
 
+    async def admin_ids(self, guild_id: int) -> frozenset[int]:
+        """Return the set of bot admin user IDs for a guild, cached per guild."""
+        cached = self._admin_cache.get(guild_id)
+        if cached is not None:
+            return cached
+        generation = self._admin_cache.generation
+        ids = frozenset(await self.list_admins(guild_id))
+        self._admin_cache.put(guild_id, ids, generation)
+        return ids
+
     async def is_admin(self, guild_id: int, user_id: int) -> bool:
         if OWNER_ID and user_id == OWNER_ID:
             return True
-        assert self.pool is not None
-        async with self.pool.connection() as conn:
-            async with conn.cursor() as cur:
-                await cur.execute(
-                    "SELECT 1 FROM guild_admins WHERE guild_id=%s AND user_id=%s",
-                    (guild_id, user_id),
-                )
-                row = await cur.fetchone()
-                return row is not None
+        return user_id in await self.admin_ids(guild_id)
 
+    @_invalidates("_admin_cache")
     async def clear_admins(self, guild_id: int) -> int:
         """Remove all bot admins for a given guild. Returns number of rows deleted."""
         assert self.pool is not None
@@ -580,6 +858,7 @@ class Database:
                 )
                 return int(cur.rowcount or 0)
 
+    @_invalidates("_admin_cache", per_guild=False)
     async def clear_admins_global(self) -> int:
         """Remove all bot admins across all guilds. Returns number of rows deleted."""
         assert self.pool is not None
@@ -588,6 +867,7 @@ class Database:
                 await cur.execute("DELETE FROM guild_admins")
                 return int(cur.rowcount or 0)
 
+    @_invalidates("_settings_cache", per_guild=False)
     async def disable_all(self) -> int:
         """Globally disable the sanitizer across all guilds. Returns rows updated."""
         assert self.pool is not None
@@ -596,6 +876,7 @@ class Database:
                 await cur.execute("UPDATE guild_settings SET enabled=FALSE")
                 return int(cur.rowcount or 0)
 
+    @_invalidates("_settings_cache")
     async def reset_guild_settings(self, guild_id: int) -> int:
         """Delete settings row for a guild so defaults apply next time. Returns rows deleted."""
         assert self.pool is not None
@@ -606,6 +887,7 @@ class Database:
                 )
                 return int(cur.rowcount or 0)
 
+    @_invalidates("_settings_cache", per_guild=False)
     async def reset_all_settings(self) -> int:
         """Delete all guild settings so defaults apply for all guilds. Returns rows deleted."""
         assert self.pool is not None
@@ -614,6 +896,7 @@ class Database:
                 await cur.execute("DELETE FROM guild_settings")
                 return int(cur.rowcount or 0)
 
+    @_invalidates("_settings_cache", "_admin_cache", per_guild=False)
     async def purge_unknown_guilds(
         self, known_guild_ids: set[int], allow_empty_known_ids: bool = False
     ) -> int:
@@ -8,10 +8,38 @@ from typing import Optional
 
 import discord  # type: ignore
 
-from .config import APPLICATION_ID, DEBUG_MODE, GuildSettings
+from .config import APPLICATION_ID, DEBUG_MODE, MESSAGE_RECHECK_SEC
+from .helpers import now_mono, touch_recent
 
 log = logging.getLogger("sanitizerbot")
 
+# Blacklisted guilds cleaned up and left in parallel during on_ready.
+_BLACKLIST_LEAVE_CONCURRENCY = 4
+
+
+async def _leave_blacklisted_guild(self, g: discord.Guild):
+    """Refresh the stored name, delete the guild's data, then leave it."""
+    try:
+        # Update stored name for this blacklisted guild (keep existing reason)
+        try:
+            await self.db.add_blacklisted_guild(g.id, None, g.name)
+        except Exception:
+            pass
+        # Always delete stored data; the two deletes touch separate tables.
+        await asyncio.gather(
+            self.db.clear_admins(g.id),
+            self.db.reset_guild_settings(g.id),
+            return_exceptions=True,
+        )
+        await g.leave()
+        log.info(
+            "[BLACKLIST] Left blacklisted guild %s (%s)",
+            g.name,
+            g.id,
+        )
+    except Exception as e:
+        log.debug("Failed leaving blacklisted guild %s: %s", g.id, e)
+
 
 async def on_ready(self):
     if self.db:
@@ -38,7 +66,7 @@ async def on_ready(self):
         log.info("[STARTUP] Connected to %d guild(s)", len(self.guilds))
 
     invite = f"https://discord.com/oauth2/authorize?client_id={APPLICATION_ID}&scope=bot%20applications.commands&permissions=134217728&integration_type=0"
-    log.info(f"[INFO] Bot invite link: {invite}")
+    log.info("[INFO] Bot invite link: %s", invite)
     if not self.guilds:
         log.warning("[STATUS] No guilds detected. Bot is not in any servers.")
 
@@ -49,36 +77,19 @@ async def on_ready(self):
             bl_set = {row[0] for row in bl}
         except Exception:
             bl_set = set()
-        if bl_set:
-            attempt = 0
-            for g in list(self.guilds):
-                if g.id in bl_set:
-                    attempt += 1
-                    try:
-                        # Update stored name for this blacklisted guild (keep existing reason)
-                        try:
-                            await self.db.add_blacklisted_guild(g.id, None, g.name)
-                        except Exception:
-                            pass
-                        # Always delete stored data
-                        try:
-                            await self.db.clear_admins(g.id)
-                            await self.db.reset_guild_settings(g.id)
-                        except Exception:
-                            pass
-                        await g.leave()
-                        log.info(
-                            "[BLACKLIST] Left blacklisted guild %s (%s)",
-                            g.name,
-                            g.id,
-                        )
-                    except Exception as e:
-                        log.debug("Failed leaving blacklisted guild %s: %s", g.id, e)
-            if attempt:
-                log.info(
-                    "[BLACKLIST] Processed %d blacklisted guild(s) on startup.",
-                    attempt,
-                )
+        targets = [g for g in self.guilds if g.id in bl_set]
+        if targets:
+            sem = asyncio.Semaphore(_BLACKLIST_LEAVE_CONCURRENCY)
+
+            async def _bounded(g: discord.Guild):
+                async with sem:
+                    await _leave_blacklisted_guild(self, g)
+
+            await asyncio.gather(*(_bounded(g) for g in targets))
+            log.info(
+                "[BLACKLIST] Processed %d blacklisted guild(s) on startup.",
+                len(targets),
+            )
 
     # Purge data for servers the bot is not in (defensive cleanup)
     if self.db:
@@ -112,29 +123,26 @@ async def on_ready(self):
             try:
                 await self._dm_owner(dm_content, respect_guild_event_optout=False)
             except Exception as e:
-                log.debug(f"Failed to send pending owner DM: {e}")
+                log.debug("Failed to send pending owner DM: %s", e)
         self._pending_owner_dms.clear()
 
 
 async def on_guild_join(self, guild: discord.Guild):
     if DEBUG_MODE:
-        log.info(f"[EVENT] Bot joined new guild: {guild.name} ({guild.id})")
+        log.info("[EVENT] Bot joined new guild: %s (%s)", guild.name, guild.id)
     # If blacklisted, DM owner with reason and immediately leave; otherwise send generic join DM
     if self.db:
         try:
-            if await self.db.is_guild_blacklisted(guild.id):
+            # One lookup answers both "is it blacklisted" and "why"
+            info = await self.db.get_blacklisted_guild(guild.id)
+            if info is not None:
                 # Update stored name for this blacklisted guild (keep reason)
                 try:
                     await self.db.add_blacklisted_guild(guild.id, None, guild.name)
                 except Exception:
                     pass
                 # DM owner a specific message for blacklisted join
-                reason_txt: Optional[str] = None
-                try:
-                    info = await self.db.get_blacklisted_guild(guild.id)
-                    reason_txt = info[1] if info else None
-                except Exception:
-                    pass
+                reason_txt: Optional[str] = info[1]
                 await self._dm_owner(
                     f"Joined blacklisted guild: {guild.name} ({guild.id})"
                     + (
@@ -172,7 +180,9 @@ async def on_guild_join(self, guild: discord.Guild):
 
 async def on_guild_remove(self, guild: discord.Guild):
     if DEBUG_MODE:
-        log.info(f"[EVENT] Bot left guild: {guild.name} ({guild.id})")
+        log.info("[EVENT] Bot left guild: %s (%s)", guild.name, guild.id)
+    self._log_channel_cache.pop(guild.id, None)
+    self._log_channel_misses.pop(guild.id, None)
     # When leaving a guild, proactively delete stored data for it
     if self.db:
         try:
@@ -199,19 +209,18 @@ async def on_guild_remove(self, guild: discord.Guild):
     await self._dm_owner(f"Left guild: {guild.name} ({guild.id}){suffix}")
 
 
+async def on_guild_channel_delete(self, channel: discord.abc.GuildChannel):
+    cached = self._log_channel_cache.get(channel.guild.id)
+    if cached is not None and cached.id == channel.id:
+        del self._log_channel_cache[channel.guild.id]
+
+
 async def on_member_join(self, member: discord.Member):
     # Don't sanitize if a configuration error is active
     if self._config_error:
         return
     if member.bot:
-        try:
-            settings = (
-                await self.db.get_settings(member.guild.id)
-                if self.db
-                else GuildSettings(member.guild.id)
-            )
-        except Exception:
-            settings = GuildSettings(member.guild.id)
+        settings = await self._load_settings(member.guild.id)
         if not settings.enforce_bots:
             return
     await self._sanitize_member(member, source="join")
@@ -221,18 +230,29 @@ async def on_message(self, message: discord.Message):
     if message.guild is None:
         return
 
+    # Skip members already checked recently in this guild; joins and sweeps
+    # still enforce policy, so this only trims redundant per-message work.
+    key = (message.guild.id, message.author.id)
+    now_ts = now_mono()
+    if MESSAGE_RECHECK_SEC > 0:
+        last = self._recently_checked.get(key)
+        if last is not None and now_ts - last < MESSAGE_RECHECK_SEC:
+            return
+
+    # Cached settings let disabled guilds and the common enforce_bots=False case
+    # return without awaiting.
+    settings = self.db.cached_settings(message.guild.id) if self.db else None
+    if settings is not None and not settings.enabled:
+        return
+
     if message.author.bot:
-        try:
-            settings = (
-                await self.db.get_settings(message.guild.id)
-                if self.db
-                else GuildSettings(message.guild.id)
-            )
-        except Exception:
-            settings = GuildSettings(message.guild.id)
+        if settings is None:
+            settings = await self._load_settings(message.guild.id)
         if not settings.enforce_bots:
             return
 
     m = message.author
     if isinstance(m, discord.Member):
         await self._sanitize_member(m, source="message")
+        if MESSAGE_RECHECK_SEC > 0:
+            touch_recent(self._recently_checked, key, now_mono(), MESSAGE_RECHECK_SEC)
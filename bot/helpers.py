@@ -12,6 +12,28 @@ def now() -> float:
     return time.time()
 
 
+def now_mono() -> float:
+    """Clock for in-memory cooldowns; unaffected by wall-clock (NTP) adjustments."""
+    return time.monotonic()
+
+
+def touch_recent(recent: dict, key, ts: float, window: float) -> None:
+    """Record ``key`` at ``ts`` and evict entries older than ``window`` seconds.
+
+    Keys are re-inserted on every write, so the dict stays ordered oldest-first
+    and eviction stops at the first live entry: amortized O(1) per call however
+    many keys are still inside the window.
+    """
+    recent.pop(key, None)
+    recent[key] = ts
+    cutoff = ts - window
+    while True:
+        oldest = next(iter(recent))
+        if recent[oldest] >= cutoff:
+            break
+        del recent[oldest]
+
+
 async def resolve_target_guild(
     interaction: discord.Interaction, server_id: Optional[str]
 ) -> Optional[int]:
@@ -59,8 +81,10 @@ async def owner_destructive_check(
         cd = 0
     if cd <= 0:
         return True
-    last = getattr(bot, "_owner_destructive_last", 0.0) or 0.0
-    now_ts = now()
+    last = getattr(bot, "_owner_destructive_last", None)
+    if last is None:
+        last = float("-inf")
+    now_ts = now_mono()
     remain = cd - (now_ts - last)
     if remain > 0:
         try:
@@ -17,6 +17,7 @@ Documentation-only edits should not modify runtime behavior.
 """
 
 import asyncio
+import functools
 import logging
 import os
 import signal
@@ -80,21 +81,36 @@ intents.presences = False
 bot = SanitizerBot(intents)
 
 
+_shutdown_tasks: set[asyncio.Task] = set()
+
+
 def _graceful_exit(signame):
     log.info("Received %s, shutting down.", signame)
-    loop = asyncio.get_event_loop()
-    loop.create_task(bot.close())
-
+    task = asyncio.create_task(bot.close())
+    # Keep a reference so the close task is not garbage collected mid-shutdown.
+    _shutdown_tasks.add(task)
+    task.add_done_callback(_shutdown_tasks.discard)
+
+
+async def _run_bot():
+    # Register handlers on the running loop so shutdown is scheduled in-loop
+    # instead of from an interrupting signal.signal() callback.
+    loop = asyncio.get_running_loop()
+    for name in ("SIGINT", "SIGTERM"):
+        try:
+            loop.add_signal_handler(
+                getattr(signal, name), functools.partial(_graceful_exit, name)
+            )
+        except (NotImplementedError, RuntimeError, AttributeError):
+            # Not supported on this platform (e.g. Windows); default handling applies.
+            pass
+    async with bot:
+        await bot.start(DISCORD_TOKEN)  # type: ignore
 
-for _sig in ("SIGINT", "SIGTERM"):
-    try:
-        signal.signal(getattr(signal, _sig), lambda *_, s=_sig: _graceful_exit(s))
-    except Exception:
-        pass
 
 if __name__ == "__main__":
     try:
         main()
-        bot.run(DISCORD_TOKEN, log_handler=None)
+        asyncio.run(_run_bot())
     except KeyboardInterrupt:
         pass
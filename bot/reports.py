@@ -133,12 +133,14 @@ async def dm_admin_report(
         )
         return
     # Build report text across all guilds
+    guilds = sorted(self.guilds, key=lambda gg: (gg.name or "", gg.id))
+    try:
+        admins = await self.db.list_admins_many(g.id for g in guilds)
+    except Exception:
+        admins = {}
     lines: list[str] = []
-    for g in sorted(self.guilds, key=lambda gg: (gg.name or "", gg.id)):
-        try:
-            ids = await self.db.list_admins(g.id)
-        except Exception:
-            ids = []
+    for g in guilds:
+        ids = admins.get(g.id, [])
         if ids:
             mentions = ", ".join(f"<@{uid}>" for uid in ids)
         else:
@@ -320,18 +322,20 @@ async def dm_all_reports(
     owner_user = interaction.user
 
     # Build admin report lines
+    guilds = sorted(self.guilds, key=lambda gg: (gg.name or "", gg.id))
+    try:
+        admins = await self.db.list_admins_many(g.id for g in guilds)
+    except Exception:
+        admins = {}
     admin_lines: list[str] = []
-    for g in sorted(self.guilds, key=lambda gg: (gg.name or "", gg.id)):
-        try:
-            ids = await self.db.list_admins(g.id)
-        except Exception:
-            ids = []
+    for g in guilds:
+        ids = admins.get(g.id, [])
         mentions = ", ".join(f"<@{uid}>" for uid in ids) if ids else "<none>"
         admin_lines.append(f"• {g.name} ({g.id}) - admins: {len(ids)} - {mentions}")
 
     # Build server settings lines
     settings_lines: list[str] = []
-    for g in sorted(self.guilds, key=lambda gg: (gg.name or "", gg.id)):
+    for g in guilds:
         try:
             s = await self.db.get_settings(g.id)
         except Exception:
@@ -6,8 +6,10 @@ Nickname sanitization helpers using the 'regex' package for Unicode handling.
 This module provides functions to sanitize member nicknames according to guild policies.
 """
 
+import functools
 import random
-from typing import Tuple
+import re as stdlib_re
+from typing import Optional, Tuple
 
 import regex as re  # type: ignore
 
@@ -17,12 +19,22 @@ from .config import GuildSettings
 _rm_marks = re.compile(r"[\p{Cf}\p{Cc}\p{Mn}\p{Me}]")
 # When preserving emoji, exclude ZWJ (U+200D) and variation selector (U+FE0F)
 _rm_marks_preserve_emoji = re.compile(r"(?![\u200D\uFE0F])[\p{Cf}\p{Cc}\p{Mn}\p{Me}]")
-_allow_ascii = re.compile(r"[^\x20-\x7E]")
+# Pure ASCII classes need no Unicode properties, and stdlib re runs them faster.
+_allow_ascii = stdlib_re.compile(r"[^\x20-\x7E]")
 _allow_ascii_or_emoji = re.compile(r"[^\x20-\x7E\p{Emoji}\u200D\uFE0F]")
 _has_letters_numbers = re.compile(r"[\p{L}\p{N}]")
 _has_emoji = re.compile(r"\p{Emoji}")
 # Extended_Pictographic avoids counting ASCII digits as emoji in length checks.
 _has_emoji_cluster = re.compile(r"\p{Extended_Pictographic}")
+# remove_marks_and_controls followed by filter_allowed_chars, as one pass. Both are
+# per-character deletions, so their union is equivalent. Printable ASCII holds no
+# marks or controls, which leaves _allow_ascii alone for the sanitize_emoji case.
+_disallowed_keep_emoji = re.compile(
+    r"[[^\x20-\x7E\p{Emoji}\u200D\uFE0F]||[[\p{Cf}\p{Cc}\p{Mn}\p{Me}]--[\u200D\uFE0F]]]",
+    re.V1,
+)
+_grapheme = re.compile(r"\X")
+_whitespace_run = re.compile(r"\s+")
 
 
 def remove_marks_and_controls(s: str, sanitize_emoji: bool = True) -> str:
@@ -44,6 +56,13 @@ def filter_allowed_chars(s: str, sanitize_emoji: bool) -> str:
     return _allow_ascii_or_emoji.sub("", s)
 
 
+def _strip_disallowed(s: str, sanitize_emoji: bool) -> str:
+    """Same result as remove_marks_and_controls then filter_allowed_chars."""
+    if sanitize_emoji:
+        return _allow_ascii.sub("", s)
+    return _disallowed_keep_emoji.sub("", s)
+
+
 def has_meaningful_chars(s: str, sanitize_emoji: bool) -> bool:
     """Ensure the sanitized result isn't just punctuation/whitespace.
 
@@ -57,8 +76,7 @@ def has_meaningful_chars(s: str, sanitize_emoji: bool) -> bool:
 
 
 def normalize_spaces(s: str) -> str:
-    s = re.sub(r"\s+", " ", s)
-    return s.strip()
+    return _whitespace_run.sub(" ", s).strip()
 
 
 def clean_orphaned_modifiers(s: str) -> str:
@@ -67,7 +85,7 @@ def clean_orphaned_modifiers(s: str) -> str:
     Processes each grapheme cluster and removes ZWJ/variation selectors from
     clusters that don't contain emoji.
     """
-    clusters = re.findall(r"\X", s)
+    clusters = _grapheme.findall(s)
     result = []
     for cluster in clusters:
         if "\u200d" in cluster or "\ufe0f" in cluster:
@@ -81,7 +99,7 @@ def clean_orphaned_modifiers(s: str) -> str:
 
 def count_non_emoji_clusters(s: str) -> int:
     """Count grapheme clusters excluding spaces, emoji, ZWJ, and variation selectors."""
-    clusters = re.findall(r"\X", s)
+    clusters = _grapheme.findall(s)
     count = 0
     for cluster in clusters:
         if cluster == " ":
@@ -104,130 +122,149 @@ def truncate_to_grapheme_boundary(s: str, max_len: int) -> str:
     if len(s) <= max_len:
         return s
 
-    kept: list[str] = []
-    current_len = 0
-    for cluster in re.findall(r"\X", s):
-        cluster_len = len(cluster)
-        if current_len + cluster_len > max_len:
+    end = 0
+    for m in _grapheme.finditer(s):
+        if m.end() > max_len:
             break
-        kept.append(cluster)
-        current_len += cluster_len
-    return "".join(kept)
+        end = m.end()
+    return s[:end]
 
 
-def sanitize_name(name: str, settings: GuildSettings) -> Tuple[str, bool]:
-    _full = remove_marks_and_controls(name, settings.sanitize_emoji)
-    _full = filter_allowed_chars(_full, settings.sanitize_emoji)
-    if not settings.preserve_spaces:
-        _full = normalize_spaces(_full)
-    # Remove orphaned ZWJ/variation selectors when emoji are allowed
-    if not settings.sanitize_emoji:
-        _full = clean_orphaned_modifiers(_full)
-    if not _full.strip() or not has_meaningful_chars(_full, settings.sanitize_emoji):
-        mode = getattr(settings, "fallback_mode", "default")
-        if mode == "randomized":
-            candidate = f"User{random.randrange(10000):04d}"
-        elif mode == "static":
-            candidate = settings.fallback_label or "Illegal Name"
-            candidate = remove_marks_and_controls(candidate, settings.sanitize_emoji)
-            candidate = filter_allowed_chars(candidate, settings.sanitize_emoji)
-            if not settings.preserve_spaces:
-                candidate = normalize_spaces(candidate)
-            if not candidate.strip():
-                candidate = "Illegal Name"
-        else:
-            # default mode returns empty to trigger username attempt
-            candidate = ""
-        if len(candidate) > settings.max_nick_length:
-            candidate = truncate_to_grapheme_boundary(
-                candidate, settings.max_nick_length
-            )
-        return candidate, True
-
-    head = name
-    tail = ""
-    if settings.check_length > 0:
-        clusters = re.findall(r"\X", name)
-        head = "".join(clusters[: settings.check_length])
-        tail = "".join(clusters[settings.check_length :])
-    else:
-        head = _full
-        tail = ""
+def _split_after_graphemes(s: str, count: int) -> Tuple[str, str]:
+    """Split s after its first count grapheme clusters without scanning the rest."""
+    end = 0
+    for i, m in enumerate(_grapheme.finditer(s)):
+        if i == count:
+            break
+        end = m.end()
+    return s[:end], s[end:]
 
-    head = remove_marks_and_controls(head, settings.sanitize_emoji)
-    head = filter_allowed_chars(head, settings.sanitize_emoji)
-    if not settings.preserve_spaces:
-        head = normalize_spaces(head)
+
+def _clean(s: str, sanitize_emoji: bool, preserve_spaces: bool) -> str:
+    """Run the character policy filters over a string."""
+    s = _strip_disallowed(s, sanitize_emoji)
+    if not preserve_spaces:
+        s = normalize_spaces(s)
     # Remove orphaned ZWJ/variation selectors when emoji are allowed
-    if not settings.sanitize_emoji:
-        head = clean_orphaned_modifiers(head)
+    if not sanitize_emoji:
+        s = clean_orphaned_modifiers(s)
+    return s
 
-    candidate = f"{head}{tail}"
 
-    if not settings.preserve_spaces:
+@functools.lru_cache(maxsize=256)
+def _static_fallback(label: str, sanitize_emoji: bool, preserve_spaces: bool) -> str:
+    """Filter a guild's static fallback label; labels rarely change, so cache it."""
+    candidate = _strip_disallowed(label, sanitize_emoji)
+    if not preserve_spaces:
         candidate = normalize_spaces(candidate)
+    if not candidate.strip():
+        candidate = "Illegal Name"
+    return candidate
+
+
+def _fallback_name(settings: GuildSettings) -> str:
+    """Build the fallback nickname for the guild's fallback_mode."""
+    mode = getattr(settings, "fallback_mode", "default")
+    if mode == "randomized":
+        candidate = f"User{random.randrange(10000):04d}"
+    elif mode == "static":
+        candidate = _static_fallback(
+            settings.fallback_label or "Illegal Name",
+            settings.sanitize_emoji,
+            settings.preserve_spaces,
+        )
+    else:
+        # default mode returns empty to trigger username attempt
+        candidate = ""
+    if len(candidate) > settings.max_nick_length:
+        candidate = truncate_to_grapheme_boundary(candidate, settings.max_nick_length)
+    return candidate
 
-    # Final full-string filtering only when enforcing the entire name
-    if settings.check_length <= 0:
-        candidate = remove_marks_and_controls(candidate, settings.sanitize_emoji)
-        candidate = filter_allowed_chars(candidate, settings.sanitize_emoji)
-        if not settings.preserve_spaces:
+
+@functools.lru_cache(maxsize=1024)
+def _sanitize_policy(
+    name: str,
+    sanitize_emoji: bool,
+    preserve_spaces: bool,
+    check_length: int,
+    min_len: int,
+    max_len: int,
+) -> Optional[str]:
+    """Deterministic part of sanitize_name; returns None when a fallback is needed.
+
+    Cached because sweeps see the same names (and settings) over and over.
+    """
+    full = _clean(name, sanitize_emoji, preserve_spaces)
+    if not full.strip() or not has_meaningful_chars(full, sanitize_emoji):
+        return None
+
+    if check_length > 0:
+        head, tail = _split_after_graphemes(name, check_length)
+        head = _clean(head, sanitize_emoji, preserve_spaces)
+        candidate = f"{head}{tail}"
+        if not preserve_spaces:
+            candidate = normalize_spaces(candidate)
+    else:
+        # Only whitespace collapsing can change on a second full-name pass (removing
+        # orphaned modifiers may leave adjacent or edge spaces), so skip the rest.
+        candidate = full
+        if not preserve_spaces and not sanitize_emoji:
             candidate = normalize_spaces(candidate)
-        # Remove orphaned ZWJ/variation selectors when emoji are allowed
-        if not settings.sanitize_emoji:
-            candidate = clean_orphaned_modifiers(candidate)
 
     # If entire result is empty after filtering, use the configured fallback label
-    used_fallback = False
     if not candidate or not candidate.strip():
-        used_fallback = True
-        mode = getattr(settings, "fallback_mode", "default")
-        if mode == "randomized":
-            candidate = f"User{random.randrange(10000):04d}"
-        elif mode == "static":
-            candidate = settings.fallback_label or "Illegal Name"
-            candidate = remove_marks_and_controls(candidate, settings.sanitize_emoji)
-            candidate = filter_allowed_chars(candidate, settings.sanitize_emoji)
-            if not settings.preserve_spaces:
-                candidate = normalize_spaces(candidate)
-            if not candidate.strip():
-                candidate = "Illegal Name"
-        else:
-            # default mode returns empty to trigger username attempt
-            candidate = ""
+        return None
 
-    if len(candidate) > settings.max_nick_length:
-        candidate = truncate_to_grapheme_boundary(candidate, settings.max_nick_length)
+    if len(candidate) > max_len:
+        candidate = truncate_to_grapheme_boundary(candidate, max_len)
 
     # Strip candidate before min length validation to match what Discord will store
     # Discord normalizes nicknames by trimming whitespace
-    stripped_candidate = candidate.strip()
-
-    min_len = getattr(settings, "min_nick_length", 0)
     if min_len > 0:
         # Count grapheme clusters excluding spaces and emoji for minimum length validation
-        cluster_count = count_non_emoji_clusters(stripped_candidate)
-        if cluster_count < min_len:
-            used_fallback = True
-            mode = getattr(settings, "fallback_mode", "default")
-            if mode == "randomized":
-                candidate = f"User{random.randrange(10000):04d}"
-            elif mode == "static":
-                candidate = settings.fallback_label or "Illegal Name"
-                candidate = remove_marks_and_controls(
-                    candidate, settings.sanitize_emoji
-                )
-                candidate = filter_allowed_chars(candidate, settings.sanitize_emoji)
-                if not settings.preserve_spaces:
-                    candidate = normalize_spaces(candidate)
-                if not candidate.strip():
-                    candidate = "Illegal Name"
-            else:
-                # default mode returns empty to trigger username attempt
-                candidate = ""
-            if len(candidate) > settings.max_nick_length:
-                candidate = truncate_to_grapheme_boundary(
-                    candidate, settings.max_nick_length
-                )
-
-    return candidate, used_fallback
+        if count_non_emoji_clusters(candidate.strip()) < min_len:
+            return None
+
+    return candidate
+
+
+def _is_clean_ascii(
+    name: str, preserve_spaces: bool, min_len: int, max_len: int
+) -> bool:
+    """True when a printable-ASCII name already satisfies every policy step.
+
+    Printable ASCII passes the character filters untouched. Spaces are only safe
+    when they are preserved, since normalization also trims the check_length head.
+    """
+    if not (name.isascii() and name.isprintable() and len(name) <= max_len):
+        return False
+    if not preserve_spaces and " " in name:
+        return False
+    if not any(c.isalnum() for c in name):
+        return False
+    if min_len > 0:
+        # ASCII has no multi-codepoint graphemes or pictographic emoji
+        stripped = name.strip()
+        if len(stripped) - stripped.count(" ") < min_len:
+            return False
+    return True
+
+
+def sanitize_name(name: str, settings: GuildSettings) -> Tuple[str, bool]:
+    min_len = getattr(settings, "min_nick_length", 0)
+    # Most nicknames are already clean ASCII; skip the regex passes (and the cache).
+    if _is_clean_ascii(
+        name, settings.preserve_spaces, min_len, settings.max_nick_length
+    ):
+        return name, False
+    candidate = _sanitize_policy(
+        name,
+        settings.sanitize_emoji,
+        settings.preserve_spaces,
+        settings.check_length,
+        min_len,
+        settings.max_nick_length,
+    )
+    if candidate is None:
+        return _fallback_name(settings), True
+    return candidate, False
@@ -92,7 +92,8 @@ def load_status_messages(self):
                         if missing_statuses:
                             # Missing required author/license credits
                             log.error(
-                                f"[STATUS] Missing required statuses: {', '.join(missing_statuses)}"
+                                "[STATUS] Missing required statuses: %s",
+                                ", ".join(missing_statuses),
                             )
                             self._config_error = True
                             self._status_messages = [
@@ -118,13 +119,14 @@ def load_status_messages(self):
                             return
 
                         log.info(
-                            f"[STATUS] Loaded {len(self._status_messages)} status messages"
+                            "[STATUS] Loaded %d status messages",
+                            len(self._status_messages),
                         )
                         self._config_error = False
                         return
                 except ValueError as e:
                     # Invalid JSON or validation errors - set 400 status
-                    log.error(f"[STATUS] Invalid bot_statuses.json: {e}")
+                    log.error("[STATUS] Invalid bot_statuses.json: %s", e)
                     self._config_error = True
                     self._status_messages = [
                         {
@@ -156,7 +158,7 @@ def load_status_messages(self):
                 "Status: Bot is now in DnD mode (red status)"
             )
     except Exception as e:
-        log.error(f"[STATUS] Failed to load status messages: {e}")
+        log.error("[STATUS] Failed to load status messages: %s", e)
         self._config_error = True
         self._status_messages = [
             {"text": "404 Flavortext not found", "duration": 30, "type": "watching"}
@@ -337,6 +339,6 @@ async def status_cycle(self):
                 )
                 await asyncio.sleep(5)
                 continue
-            log.error(f"[STATUS] Failed to update status: {e}")
+            log.error("[STATUS] Failed to update status: %s", e)
             track_error(self, f"Status cycle update failed: {e}")
             await asyncio.sleep(30)  # Wait before retrying
@@ -3,6 +3,7 @@
 """Background tasks for SanitizerBot."""
 
 import asyncio
+import contextlib
 import logging
 
 import discord  # type: ignore
@@ -17,10 +18,15 @@ from .config import (
     SWEEP_RETRY_BASE_SEC,
     GuildSettings,
 )
+from .helpers import now
 
 log = logging.getLogger("sanitizerbot")
 
 _RETRYABLE_HTTP_STATUSES = {429, 500, 502, 503, 504}
+# Members buffered per sweep batch; each batch loads its cooldowns in one query.
+_SWEEP_COOLDOWN_BATCH = 100
+# Fetched batches queued ahead of the sanitizer while paging over HTTP.
+_SWEEP_PREFETCH_BATCHES = 4
 
 
 def _is_retryable_http_exception(exc: discord.HTTPException) -> bool:
@@ -34,21 +40,152 @@ def _compute_retry_delay(exc: discord.HTTPException, attempt: int) -> float:
     return min(SWEEP_RETRY_BASE_SEC * (2**attempt), 30.0)
 
 
+async def _sanitize_member_batch(
+    self, members: list[discord.Member], source: str
+) -> int:
+    """Sanitize a batch of members, loading their cooldowns with one query."""
+    cooldowns = None
+    if self.db:
+        try:
+            cooldowns = await self.db.get_cooldowns(m.id for m in members)
+        except Exception as e:
+            # Fall back to per-member cooldown lookups.
+            log.debug("Failed to load cooldowns for sweep batch: %s", e)
+    changed = 0
+    edited: list[int] = []
+    for member in members:
+        if await self._sanitize_member(
+            member, source=source, cooldowns=cooldowns, edited_ids=edited
+        ):
+            changed += 1
+    if edited and self.db:
+        try:
+            await self.db.set_cooldowns(edited, now())
+        except Exception as e:
+            log.debug("Failed to store cooldowns for sweep batch: %s", e)
+    # With settings and cooldowns already in memory, clean members never suspend;
+    # hand the loop back between batches so commands are not held up by a sweep.
+    await asyncio.sleep(0)
+    return changed
+
+
+async def _sweep_cached_members(
+    self,
+    guild: discord.Guild,
+    settings: GuildSettings,
+    source: str,
+    on_progress=None,
+) -> tuple[int, int]:
+    """Sweep a fully chunked guild from the gateway member cache (no HTTP paging)."""
+    processed = 0
+    changed = 0
+    members = [m for m in guild.members if settings.enforce_bots or not m.bot]
+    for i in range(0, len(members), _SWEEP_COOLDOWN_BATCH):
+        batch = members[i : i + _SWEEP_COOLDOWN_BATCH]
+        changed += await _sanitize_member_batch(self, batch, source)
+        processed += len(batch)
+        if on_progress is not None:
+            await on_progress(processed, changed)
+    return processed, changed
+
+
+async def _prefetch_members(
+    guild: discord.Guild,
+    settings: GuildSettings,
+    after,
+    queue: asyncio.Queue,
+):
+    """Page members into ``queue`` in batches, ending with ``None`` or the error."""
+    batch: list[discord.Member] = []
+    try:
+        async for member in guild.fetch_members(limit=None, after=after):
+            if member.bot and not settings.enforce_bots:
+                continue
+            batch.append(member)
+            if len(batch) >= _SWEEP_COOLDOWN_BATCH:
+                await queue.put(batch)
+                batch = []
+        if batch:
+            await queue.put(batch)
+        await queue.put(None)
+    except discord.HTTPException as e:
+        if batch:
+            await queue.put(batch)
+        await queue.put(e)
+
+
+async def _next_prefetched(queue: asyncio.Queue, producer: asyncio.Task):
+    """Return the next queued item, re-raising the producer's error if it died.
+
+    The producer only queues its own end marker for a clean finish or an HTTP
+    error; anything else (connection errors, cancellation) is surfaced here so
+    the sweep cannot wait on an empty queue forever.
+    """
+    if not queue.empty() or producer.done():
+        if not queue.empty():
+            return queue.get_nowait()
+        if producer.cancelled():
+            raise RuntimeError("Member prefetch was cancelled.")
+        producer.result()
+        raise RuntimeError("Member prefetch stopped without finishing.")
+    getter = asyncio.ensure_future(queue.get())
+    try:
+        await asyncio.wait({getter, producer}, return_when=asyncio.FIRST_COMPLETED)
+    finally:
+        if not getter.done():
+            getter.cancel()
+    if getter.done() and not getter.cancelled():
+        return getter.result()
+    return await _next_prefetched(queue, producer)
+
+
 async def sweep_guild_members(
-    self, guild: discord.Guild, settings: GuildSettings, source: str
+    self,
+    guild: discord.Guild,
+    settings: GuildSettings,
+    source: str,
+    on_progress=None,
 ):
-    """Sweep one guild with bounded retries for transient HTTP failures."""
+    """Sweep one guild with bounded retries for transient HTTP failures.
+
+    With the members intent the guild is chunked over the gateway on its first
+    sweep and later sweeps read the member cache, which member events keep current.
+
+    Members arrive in ID order, so a retry resumes after the last handled batch
+    instead of paging the whole guild again.
+
+    ``on_progress(processed, changed)`` is awaited after every batch when given.
+    """
+    if self.intents.members:
+        try:
+            if not guild.chunked:
+                await guild.chunk(cache=True)
+        except Exception as e:
+            log.debug("Failed to chunk guild %s for sweep: %s", guild.id, e)
+        if guild.chunked:
+            processed, changed = await _sweep_cached_members(
+                self, guild, settings, source, on_progress
+            )
+            return processed, changed, None
+
+    processed = 0
+    changed = 0
+    resume_after = None
     for attempt in range(SWEEP_FETCH_MAX_RETRIES + 1):
-        processed = 0
-        changed = 0
+        # The next page is fetched while the current batch is being sanitized.
+        queue: asyncio.Queue = asyncio.Queue(maxsize=_SWEEP_PREFETCH_BATCHES)
+        producer = asyncio.create_task(
+            _prefetch_members(guild, settings, resume_after, queue)
+        )
         try:
-            async for member in guild.fetch_members(limit=None):
-                if member.bot and not settings.enforce_bots:
-                    continue
-                did_change = await self._sanitize_member(member, source=source)
-                if did_change:
-                    changed += 1
-                processed += 1
+            while (batch := await _next_prefetched(queue, producer)) is not None:
+                if isinstance(batch, discord.HTTPException):
+                    raise batch
+                changed += await _sanitize_member_batch(self, batch, source)
+                processed += len(batch)
+                resume_after = discord.Object(id=batch[-1].id)
+                if on_progress is not None:
+                    await on_progress(processed, changed)
             return processed, changed, None
         except discord.HTTPException as e:
             if (
@@ -67,7 +204,59 @@ async def sweep_guild_members(
                 e,
             )
             await asyncio.sleep(delay)
-    return 0, 0, None
+        finally:
+            if not producer.done():
+                producer.cancel()
+                with contextlib.suppress(asyncio.CancelledError):
+                    await producer
+    return processed, changed, None
+
+
+async def sweep_guild(self, guild: discord.Guild):
+    """Load settings for one guild and sweep it when the sanitizer is enabled."""
+    settings = await self._load_settings(guild.id)
+    if not settings.enabled:
+        return
+    # Every edit would be refused; skip the member walk instead of finding that
+    # out once per non-compliant member.
+    me = guild.me
+    if me is None or not me.guild_permissions.manage_nicknames:
+        log.debug(
+            "Skipping sweep of %s: missing Manage Nicknames permission.", guild.id
+        )
+        return
+
+    processed, changed, sweep_error = await sweep_guild_members(
+        self, guild, settings, source="sweep"
+    )
+    if sweep_error:
+        if DEBUG_MODE:
+            log.warning(
+                "Member sweep rate limit/HTTP error in %s: %s",
+                guild.name,
+                sweep_error,
+            )
+        # Mark as non-critical - upstream/rate-limit errors shouldn't trigger red status
+        self._track_error(
+            f"Member sweep HTTP error in {guild.name}: {sweep_error}",
+            guild.id,
+            critical=False,
+        )
+    elif processed and DEBUG_MODE:
+        log.info(
+            "Sweep processed %d members and changed %d in %s",
+            processed,
+            changed,
+            guild.name,
+        )
+
+
+async def _sweep_guild_bounded(self, guild: discord.Guild):
+    # Guilds overlap up to SWEEP_GUILD_CONCURRENCY; members within a guild stay serial.
+    async with self._sweep_guild_semaphore:
+        await sweep_guild(self, guild)
+        if SWEEP_GUILD_DELAY_SEC > 0:
+            await asyncio.sleep(SWEEP_GUILD_DELAY_SEC)
 
 
 @tasks.loop(seconds=SWEEP_INTERVAL_SEC)
@@ -87,45 +276,14 @@ async def member_sweep(self):
     self._sweep_running = True
     try:
         async with self._sweep_lock:
-            guilds = list(self.guilds)
-            for idx, guild in enumerate(guilds):
-                settings = GuildSettings(guild.id)
-                if self.db:
-                    try:
-                        settings = await self.db.get_settings(guild.id)
-                    except Exception as e:
-                        log.debug(
-                            "Failed to get settings for guild %s: %s", guild.id, e
-                        )
-                if not settings.enabled:
-                    continue
-
-                processed, changed, sweep_error = await sweep_guild_members(
-                    self, guild, settings, source="sweep"
-                )
-                if sweep_error:
-                    if DEBUG_MODE:
-                        log.warning(
-                            "Member sweep rate limit/HTTP error in %s: %s",
-                            guild.name,
-                            sweep_error,
-                        )
-                    # Mark as non-critical - upstream/rate-limit errors shouldn't trigger red status
-                    self._track_error(
-                        f"Member sweep HTTP error in {guild.name}: {sweep_error}",
-                        guild.id,
-                        critical=False,
-                    )
-                elif processed and DEBUG_MODE:
-                    log.info(
-                        "Sweep processed %d members and changed %d in %s",
-                        processed,
-                        changed,
-                        guild.name,
-                    )
-
-                if SWEEP_GUILD_DELAY_SEC > 0 and idx < len(guilds) - 1:
-                    await asyncio.sleep(SWEEP_GUILD_DELAY_SEC)
+            guilds = self.guilds
+            results = await asyncio.gather(
+                *(_sweep_guild_bounded(self, g) for g in guilds),
+                return_exceptions=True,
+            )
+            for guild, result in zip(guilds, results):
+                if isinstance(result, Exception):
+                    log.debug("Member sweep failed for guild %s: %s", guild.id, result)
     finally:
         self._sweep_running = False
 